@@ -3,13 +3,16 @@ Admin API routes — stats, video management, categories, featured.
 Auth: adman JWT with admin role, or legacy X-Admin-Key fallback.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from models import get_db, Video, Transcript, Collection
 from middleware.auth import require_admin
+from services.cache import cache, ADMIN_STATS, invalidate_videos, invalidate_collections
+from api.conditional import not_modified
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -21,32 +24,38 @@ class UpdateVideoAdmin(BaseModel):
 
 
 @router.get("/stats", dependencies=[Depends(require_admin)])
-async def admin_stats(db: Session = Depends(get_db)):
+async def admin_stats(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     """Dashboard stats."""
-    total_videos = db.query(func.count(Video.id)).scalar()
-    ready_videos = db.query(func.count(Video.id)).filter(Video.status == "ready").scalar()
-    failed_videos = db.query(func.count(Video.id)).filter(Video.status == "failed").scalar()
-    featured_count = db.query(func.count(Video.id)).filter(Video.is_featured == True).scalar()
-    total_collections = db.query(func.count(Collection.id)).scalar()
+    if (cached := cache.get(ADMIN_STATS)) is not None:
+        return not_modified(request, response, cached) or cached
+
+    # One aggregate round trip instead of five scalar count queries
+    counts = (await db.execute(
+        select(
+            func.count(Video.id),
+            func.count(Video.id).filter(Video.status == "ready"),
+            func.count(Video.id).filter(Video.status == "failed"),
+            func.count(Video.id).filter(Video.is_featured.is_(True)),
+            select(func.count(Collection.id)).scalar_subquery(),
+        )
+    )).one()
+    total_videos, ready_videos, failed_videos, featured_count, total_collections = counts
 
     # Source breakdown
-    source_counts = (
-        db.query(Video.source, func.count(Video.id))
-        .group_by(Video.source)
-        .all()
-    )
+    source_counts = (await db.execute(
+        select(Video.source, func.count(Video.id)).group_by(Video.source)
+    )).all()
     sources = {source: count for source, count in source_counts}
 
     # Category breakdown
-    category_counts = (
-        db.query(Video.category, func.count(Video.id))
-        .filter(Video.category != None)
+    category_counts = (await db.execute(
+        select(Video.category, func.count(Video.id))
+        .where(Video.category != None)
         .group_by(Video.category)
-        .all()
-    )
+    )).all()
     categories = {cat: count for cat, count in category_counts}
 
-    return {
+    stats = {
         "total_videos": total_videos,
         "ready_videos": ready_videos,
         "failed_videos": failed_videos,
@@ -55,6 +64,8 @@ async def admin_stats(db: Session = Depends(get_db)):
         "sources": sources,
         "categories": categories,
     }
+    cache.set(ADMIN_STATS, stats)
+    return not_modified(request, response, stats) or stats
 
 
 @router.get("/videos", dependencies=[Depends(require_admin)])
@@ -63,38 +74,37 @@ async def admin_list_videos(
     category: str | None = None,
     featured: bool | None = None,
     search: str | None = None,
-    db: Session = Depends(get_db),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
 ):
     """List all videos with filters."""
-    query = db.query(Video).order_by(Video.created_at.desc())
+    # Project only the serialized columns — no ORM hydration, no unused fields
+    stmt = select(
+        Video.id, Video.url, Video.title, Video.source, Video.duration,
+        Video.thumbnail, Video.channel, Video.status, Video.category,
+        Video.is_featured, Video.created_at,
+    ).order_by(Video.created_at.desc())
 
     if status:
-        query = query.filter(Video.status == status)
+        stmt = stmt.where(Video.status == status)
     if category:
-        query = query.filter(Video.category == category)
+        stmt = stmt.where(Video.category == category)
     if featured is not None:
-        query = query.filter(Video.is_featured == featured)
+        stmt = stmt.where(Video.is_featured == featured)
     if search:
-        query = query.filter(
+        stmt = stmt.where(
             Video.title.ilike(f"%{search}%") | Video.channel.ilike(f"%{search}%")
         )
 
-    videos = query.all()
+    result = await db.execute(stmt.limit(limit).offset(offset))
     return [
         {
-            "id": v.id,
-            "url": v.url,
-            "title": v.title,
-            "source": v.source,
-            "duration": v.duration,
-            "thumbnail": v.thumbnail,
-            "channel": v.channel,
-            "status": v.status,
-            "category": v.category,
-            "is_featured": v.is_featured or False,
-            "created_at": v.created_at.isoformat() if v.created_at else None,
+            **dict(row),
+            "is_featured": row["is_featured"] or False,
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
         }
-        for v in videos
+        for row in result.mappings()
     ]
 
 
@@ -102,44 +112,55 @@ async def admin_list_videos(
 async def admin_update_video(
     video_id: str,
     req: UpdateVideoAdmin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Update video metadata (category, featured, title)."""
-    video = db.query(Video).filter(Video.id == video_id).first()
-    if not video:
+    changes = req.model_dump(exclude_none=True)
+    if changes:
+        # Core UPDATE ... RETURNING: one statement, only changed columns
+        stmt = (
+            update(Video)
+            .where(Video.id == video_id)
+            .values(**changes)
+            .returning(Video.id, Video.category, Video.is_featured, Video.title)
+        )
+    else:
+        stmt = select(Video.id, Video.category, Video.is_featured, Video.title).where(
+            Video.id == video_id
+        )
+    row = (await db.execute(stmt)).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Video not found")
-
-    if req.category is not None:
-        video.category = req.category
-    if req.is_featured is not None:
-        video.is_featured = req.is_featured
-    if req.title is not None:
-        video.title = req.title
-
-    db.commit()
+    await db.commit()
+    invalidate_videos()
     return {
         "success": True,
-        "id": video.id,
-        "category": video.category,
-        "is_featured": video.is_featured,
-        "title": video.title,
+        "id": row.id,
+        "category": row.category,
+        "is_featured": row.is_featured,
+        "title": row.title,
     }
 
 
 @router.delete("/videos/{video_id}", dependencies=[Depends(require_admin)])
-async def admin_delete_video(video_id: str, db: Session = Depends(get_db)):
+async def admin_delete_video(video_id: str, db: AsyncSession = Depends(get_db)):
     """Hard delete a video (admin only)."""
-    from services.downloader import VIDEOS_DIR
+    from services.downloader import remove_video_file
 
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = (await db.execute(
+        select(Video)
+        .options(selectinload(Video.transcript), selectinload(Video.collection_items))
+        .where(Video.id == video_id)
+    )).scalar_one_or_none()
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
     if video.filename:
-        video_path = VIDEOS_DIR / video.filename
-        if video_path.exists():
-            video_path.unlink()
+        await remove_video_file(video.filename)
 
-    db.delete(video)
-    db.commit()
+    await db.delete(video)
+    await db.commit()
+    invalidate_videos()
+    # Cascaded collection_items change video_count in the collections list
+    invalidate_collections()
     return {"success": True}
@@ -2,12 +2,16 @@
 Collection API routes — CRUD for learning collections.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from models import get_db, Collection, CollectionItem, Video
+from services.cache import cache, COLLECTIONS_LIST, invalidate_collections
+from api.conditional import not_modified
 
 router = APIRouter(prefix="/api/collections", tags=["collections"])
 
@@ -23,11 +27,12 @@ class AddVideoRequest(BaseModel):
 
 
 @router.post("")
-async def create_collection(req: CreateCollectionRequest, db: Session = Depends(get_db)):
+async def create_collection(req: CreateCollectionRequest, db: AsyncSession = Depends(get_db)):
     collection = Collection(name=req.name, description=req.description)
     db.add(collection)
-    db.commit()
-    db.refresh(collection)
+    await db.commit()
+    await db.refresh(collection)
+    invalidate_collections()
     return {
         "id": collection.id,
         "name": collection.name,
@@ -36,23 +41,51 @@ async def create_collection(req: CreateCollectionRequest, db: Session = Depends(
 
 
 @router.get("")
-async def list_collections(db: Session = Depends(get_db)):
-    collections = db.query(Collection).order_by(Collection.created_at.desc()).all()
-    return [
+async def list_collections(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    is_default_page = limit == 50 and offset == 0
+    if is_default_page and (cached := cache.get(COLLECTIONS_LIST)) is not None:
+        return not_modified(request, response, cached) or cached
+
+    # Aggregate item counts in the same query instead of loading every item row;
+    # project columns directly, no ORM hydration
+    result = await db.execute(
+        select(
+            Collection.id, Collection.name, Collection.description,
+            Collection.created_at,
+            func.count(CollectionItem.id).label("video_count"),
+        )
+        .outerjoin(CollectionItem)
+        .group_by(Collection.id)
+        .order_by(Collection.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    payload = [
         {
-            "id": c.id,
-            "name": c.name,
-            "description": c.description,
-            "video_count": len(c.items),
-            "created_at": c.created_at.isoformat() if c.created_at else None,
+            **dict(row),
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
         }
-        for c in collections
+        for row in result.mappings()
     ]
+    if is_default_page:
+        cache.set(COLLECTIONS_LIST, payload)
+    return not_modified(request, response, payload) or payload
 
 
 @router.get("/{collection_id}")
-async def get_collection(collection_id: str, db: Session = Depends(get_db)):
-    collection = db.query(Collection).filter(Collection.id == collection_id).first()
+async def get_collection(collection_id: str, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(Collection)
+        .options(selectinload(Collection.items).selectinload(CollectionItem.video))
+        .where(Collection.id == collection_id)
+    )
+    collection = result.scalar_one_or_none()
     if not collection:
         raise HTTPException(status_code=404, detail="Collection not found")
 
@@ -84,22 +117,24 @@ async def get_collection(collection_id: str, db: Session = Depends(get_db)):
 async def add_video_to_collection(
     collection_id: str,
     req: AddVideoRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    collection = db.query(Collection).filter(Collection.id == collection_id).first()
+    result = await db.execute(select(Collection).where(Collection.id == collection_id))
+    collection = result.scalar_one_or_none()
     if not collection:
         raise HTTPException(status_code=404, detail="Collection not found")
 
-    video = db.query(Video).filter(Video.id == req.video_id).first()
+    result = await db.execute(select(Video).where(Video.id == req.video_id))
+    video = result.scalar_one_or_none()
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
     # Check duplicate
-    existing = (
-        db.query(CollectionItem)
-        .filter(CollectionItem.collection_id == collection_id, CollectionItem.video_id == req.video_id)
-        .first()
+    result = await db.execute(
+        select(CollectionItem)
+        .where(CollectionItem.collection_id == collection_id, CollectionItem.video_id == req.video_id)
     )
+    existing = result.scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=409, detail="Video already in collection")
 
@@ -109,7 +144,8 @@ async def add_video_to_collection(
         notes=req.notes,
     )
     db.add(item)
-    db.commit()
+    await db.commit()
+    invalidate_collections()
     return {"success": True, "item_id": item.id}
 
 
@@ -117,27 +153,34 @@ async def add_video_to_collection(
 async def remove_video_from_collection(
     collection_id: str,
     video_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    item = (
-        db.query(CollectionItem)
-        .filter(CollectionItem.collection_id == collection_id, CollectionItem.video_id == video_id)
-        .first()
+    result = await db.execute(
+        select(CollectionItem)
+        .where(CollectionItem.collection_id == collection_id, CollectionItem.video_id == video_id)
     )
+    item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
+    invalidate_collections()
     return {"success": True}
 
 
 @router.delete("/{collection_id}")
-async def delete_collection(collection_id: str, db: Session = Depends(get_db)):
-    collection = db.query(Collection).filter(Collection.id == collection_id).first()
+async def delete_collection(collection_id: str, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(Collection)
+        .options(selectinload(Collection.items))
+        .where(Collection.id == collection_id)
+    )
+    collection = result.scalar_one_or_none()
     if not collection:
         raise HTTPException(status_code=404, detail="Collection not found")
 
-    db.delete(collection)
-    db.commit()
+    await db.delete(collection)
+    await db.commit()
+    invalidate_collections()
     return {"success": True}
@@ -0,0 +1,28 @@
+"""
+Conditional GET helpers — weak ETags computed over the serialized
+payload so repeat polls (the frontend polls during transcription) cost a
+hash instead of a full response body.
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(payload: Any) -> str:
+    digest = hashlib.md5(
+        json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, response: Response, payload: Any) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match is current,
+    otherwise stamp the ETag header and return None."""
+    etag = make_etag(payload)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
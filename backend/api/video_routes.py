@@ -3,21 +3,29 @@ Video API routes — download, transcribe, list, get, delete.
 """
 
 import asyncio
-import re
+import hashlib
 from datetime import datetime
+from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from models import get_db, Video, Transcript
-from services.downloader import download_video, get_video_info, VIDEOS_DIR
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import flag_modified
+
+from models import get_db, uuid7, Video, Transcript, CollectionItem
+from services.downloader import download_video, get_video_info, remove_video_file, VIDEOS_DIR, _detect_source
 from services.transcriber import transcriber
 from services.translator import translate_segments
 from services.vocabulary import analyze_segments
 from services.appreciation import generate_appreciation
-from services.titler import generate_title_and_appreciation
+from services.ai import analyze_full
+from services.cache import cache, VIDEOS_LIST, invalidate_videos, invalidate_collections
+from services.executors import TRANSCRIBE_POOL, AI_POOL
 from api.websocket import manager
+from api.conditional import not_modified
 
 router = APIRouter(prefix="/api/videos", tags=["videos"])
 
@@ -34,27 +42,57 @@ class BatchDeleteRequest(BaseModel):
     video_ids: list[str]
 
 
-URL_PATTERNS = [
-    re.compile(r"https?://(www\.)?(youtube\.com|youtu\.be)/"),
-    re.compile(r"https?://(www\.)?instagram\.com/"),
-    re.compile(r"https?://(www\.)?(bilibili\.com|b23\.tv)/"),
-    re.compile(r"https?://(www\.)?tiktok\.com/"),
-]
+ALLOWED_HOSTS = frozenset({
+    "youtube.com", "youtu.be",
+    "instagram.com",
+    "bilibili.com", "b23.tv",
+    "tiktok.com",
+})
 
 
 def _is_valid_url(url: str) -> bool:
-    return any(p.match(url) for p in URL_PATTERNS)
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return False
+    return parsed.netloc.lower().removeprefix("www.") in ALLOWED_HOSTS
+
+
+def _content_hash(transcript: Transcript) -> str:
+    if transcript.content_hash:
+        return transcript.content_hash
+    return hashlib.sha256((transcript.full_text or "").encode("utf-8")).hexdigest()
+
+
+async def _get_video(
+    db: AsyncSession,
+    video_id: str,
+    with_transcript: bool = False,
+    for_delete: bool = False,
+) -> Video | None:
+    stmt = select(Video).where(Video.id == video_id)
+    if with_transcript:
+        # One-to-one: a JOIN fetches the transcript in the same round trip
+        stmt = stmt.options(joinedload(Video.transcript))
+    if for_delete:
+        # ORM cascade needs the child rows loaded; lazy loads raise under asyncio
+        stmt = stmt.options(
+            selectinload(Video.transcript),
+            selectinload(Video.collection_items),
+        )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
 
 
 @router.post("/process")
-async def process_video(req: ProcessRequest, db: Session = Depends(get_db)):
+async def process_video(req: ProcessRequest, db: AsyncSession = Depends(get_db)):
     """Download a video and transcribe it. Returns immediately, processes in background."""
 
     if not _is_valid_url(req.url):
         raise HTTPException(status_code=400, detail="Unsupported URL. Use YouTube, Instagram, Bilibili, or TikTok links.")
 
     # Dedup: check if this URL is already processed
-    existing = db.query(Video).filter(Video.url == req.url).first()
+    result = await db.execute(select(Video).where(Video.url == req.url))
+    existing = result.scalar_one_or_none()
     if existing:
         return {
             "success": True,
@@ -64,63 +102,107 @@ async def process_video(req: ProcessRequest, db: Session = Depends(get_db)):
             "duplicate": True,
         }
 
-    # Fetch info first
-    info = await get_video_info(req.url)
-
-    # Create DB record
-    video = Video(
-        url=req.url,
-        title=info.get("title"),
-        source=info.get("source", "unknown"),
-        duration=info.get("duration"),
-        thumbnail=info.get("thumbnail"),
-        channel=info.get("channel"),
-        status="downloading",
+    # Insert a minimal record right away; metadata is filled in by the
+    # pipeline so the HTTP response doesn't wait on a yt-dlp info fetch.
+    # ON CONFLICT with the unique url index keeps concurrent duplicates safe.
+    stmt = (
+        sqlite_insert(Video)
+        .values(
+            id=uuid7(),
+            url=req.url,
+            source=_detect_source(req.url),
+            status="pending",
+            is_featured=False,
+            created_at=datetime.utcnow(),
+        )
+        .on_conflict_do_nothing(index_elements=["url"])
+        .returning(Video.id)
     )
-    db.add(video)
-    db.commit()
-    db.refresh(video)
+    row = (await db.execute(stmt)).first()
+    await db.commit()
+
+    if row is None:
+        # Lost the race to another submission of the same URL
+        result = await db.execute(select(Video).where(Video.url == req.url))
+        existing = result.scalar_one()
+        return {
+            "success": True,
+            "video_id": existing.id,
+            "title": existing.title,
+            "status": existing.status,
+            "duplicate": True,
+        }
 
-    video_id = video.id
+    invalidate_videos()
+    video_id = row.id
 
-    # Run download + transcribe in background
+    # Run info fetch + download + transcribe in background
     asyncio.create_task(_process_pipeline(video_id, req.url))
 
     return {
         "success": True,
         "video_id": video_id,
-        "title": video.title,
-        "status": "downloading",
+        "title": None,
+        "status": "pending",
     }
 
 
 async def _process_pipeline(video_id: str, url: str):
-    """Background pipeline: download → transcribe → save transcript."""
-    from models.database import SessionLocal
+    """Background pipeline: download → transcribe → save transcript.
+
+    Each DB write runs in its own short-lived session so no connection is
+    held across the minutes-long download/transcribe/AI awaits.
+    """
+    from models.database import AsyncSessionLocal
 
-    db = SessionLocal()
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if not video:
-            return
+        # Step 0: Metadata fetch (cached so re-submissions skip yt-dlp)
+        info_key = f"info:{url}"
+        info = cache.get(info_key)
+        if info is None:
+            info = await get_video_info(url)
+            if info.get("success"):
+                cache.set(info_key, info, ttl=600)
+
+        async with AsyncSessionLocal() as db:
+            video = await db.get(Video, video_id)
+            if not video:
+                return
+            video.title = info.get("title") or video.title
+            video.duration = info.get("duration") or video.duration
+            video.thumbnail = info.get("thumbnail") or video.thumbnail
+            video.channel = info.get("channel") or video.channel
+            video.status = "downloading"
+            await db.commit()
+        invalidate_videos()
 
         # Step 1: Download
         result = await download_video(url, video_id)
 
         if not result.get("success"):
-            video.status = "failed"
-            video.error_message = result.get("error", "Download failed")
-            db.commit()
+            async with AsyncSessionLocal() as db:
+                video = await db.get(Video, video_id)
+                if video:
+                    video.status = "failed"
+                    video.error_message = result.get("error", "Download failed")
+                    await db.commit()
+            invalidate_videos()
             return
 
-        video.filename = result.get("filename")
-        video.title = result.get("title") or video.title
-        video.duration = result.get("duration") or video.duration
-        video.thumbnail = result.get("thumbnail") or video.thumbnail
-        video.channel = result.get("channel") or video.channel
-        video.source = result.get("source") or video.source
-        video.status = "transcribing"
-        db.commit()
+        filename = result.get("filename")
+        async with AsyncSessionLocal() as db:
+            video = await db.get(Video, video_id)
+            if not video:
+                return
+            video.filename = filename
+            video.title = result.get("title") or video.title
+            video.duration = result.get("duration") or video.duration
+            video.thumbnail = result.get("thumbnail") or video.thumbnail
+            video.channel = result.get("channel") or video.channel
+            video.source = result.get("source") or video.source
+            video.status = "transcribing"
+            await db.commit()
+        invalidate_videos()
 
         await manager.broadcast({
             "type": "transcribe_started",
@@ -128,43 +210,73 @@ async def _process_pipeline(video_id: str, url: str):
         })
 
         # Step 2: Transcribe (CPU-bound, run in thread)
-        video_path = str(VIDEOS_DIR / video.filename)
+        video_path = str(VIDEOS_DIR / filename)
 
         loop = asyncio.get_running_loop()
         segments = await loop.run_in_executor(
-            None, transcriber.transcribe, video_path
+            TRANSCRIBE_POOL, transcriber.transcribe, video_path
         )
 
         # Step 3: Save transcript
-        transcript = Transcript(
-            video_id=video_id,
-            language="en",
-            segments=transcriber.segments_to_dict(segments),
-            full_text=transcriber.segments_to_full_text(segments),
-        )
-        db.add(transcript)
-
-        video.status = "ready"
-        video.completed_at = datetime.utcnow()
-        db.commit()
-
-        # Step 4: Auto-generate title + appreciation in one AI call
+        async with AsyncSessionLocal() as db:
+            video = await db.get(Video, video_id)
+            if not video:
+                return
+            full_text = transcriber.segments_to_full_text(segments)
+            transcript = Transcript(
+                video_id=video_id,
+                language="en",
+                segments=transcriber.segments_to_dict(segments),
+                full_text=full_text,
+                content_hash=hashlib.sha256(full_text.encode("utf-8")).hexdigest(),
+            )
+            db.add(transcript)
+            video.status = "ready"
+            video.completed_at = datetime.utcnow()
+            await db.commit()
+        invalidate_videos()
+
+        # Step 4: Title + appreciation + translations + vocabulary, one AI call
+        ai_title = None
         try:
             full_text = transcriber.segments_to_full_text(segments)
+            segment_texts = [s.text for s in segments]
             analysis = await loop.run_in_executor(
-                None, generate_title_and_appreciation, full_text
+                AI_POOL, analyze_full, full_text, segment_texts
             )
-            if analysis.get("title"):
-                video.title = analysis["title"]
+            ai_title = analysis.get("title")
             appreciation = {
                 k: analysis[k] for k in ("theme", "keyPoints", "goldenQuotes")
                 if k in analysis
             }
-            if appreciation.get("theme"):
-                transcript.appreciation = appreciation
-                from sqlalchemy.orm.attributes import flag_modified
-                flag_modified(transcript, "appreciation")
-            db.commit()
+            translations = analysis.get("translations")
+            vocabulary = analysis.get("vocabulary")
+            if ai_title or appreciation.get("theme") or translations or vocabulary:
+                async with AsyncSessionLocal() as db:
+                    video = await db.get(Video, video_id, options=[joinedload(Video.transcript)])
+                    if video:
+                        if ai_title:
+                            video.title = ai_title
+                        if video.transcript:
+                            now = datetime.utcnow()
+                            if appreciation.get("theme"):
+                                video.transcript.appreciation = appreciation
+                                video.transcript.appreciated_at = now
+                            if translations:
+                                video.transcript.translated_at = now
+                            if vocabulary:
+                                video.transcript.analyzed_at = now
+                            if translations or vocabulary:
+                                merged = []
+                                for i, seg in enumerate(video.transcript.segments):
+                                    if translations:
+                                        seg = {**seg, "translation": translations[i]}
+                                    if vocabulary:
+                                        seg = {**seg, "vocabulary": vocabulary[i]}
+                                    merged.append(seg)
+                                video.transcript.segments = merged
+                        await db.commit()
+                invalidate_videos()
         except Exception as ai_err:
             print(f"[Pipeline] Auto-analysis failed (non-fatal): {ai_err}")
 
@@ -172,78 +284,113 @@ async def _process_pipeline(video_id: str, url: str):
             "type": "transcribe_completed",
             "data": {
                 "video_id": video_id,
-                "title": video.title,
+                "title": ai_title or result.get("title"),
                 "segment_count": len(segments),
             },
         })
 
     except Exception as e:
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if video:
-            video.status = "failed"
-            video.error_message = str(e)
-            db.commit()
+        async with AsyncSessionLocal() as db:
+            video = await db.get(Video, video_id)
+            if video:
+                video.status = "failed"
+                video.error_message = str(e)
+                await db.commit()
+        invalidate_videos()
 
         await manager.broadcast({
             "type": "process_error",
             "data": {"video_id": video_id, "error": str(e)},
         })
-    finally:
-        db.close()
 
 
 @router.get("")
-async def list_videos(db: Session = Depends(get_db)):
-    """List all videos, newest first."""
-    videos = db.query(Video).order_by(Video.created_at.desc()).all()
-    return [
+async def list_videos(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """List videos, newest first, paginated."""
+    # Only the default first page is cached — it's what the frontend polls
+    is_default_page = limit == 50 and offset == 0
+    if is_default_page and (cached := cache.get(VIDEOS_LIST)) is not None:
+        return not_modified(request, response, cached) or cached
+
+    # Project only the serialized columns — no ORM hydration, no unused fields
+    result = await db.execute(
+        select(
+            Video.id, Video.url, Video.title, Video.source, Video.duration,
+            Video.thumbnail, Video.channel, Video.status, Video.created_at,
+        )
+        .order_by(Video.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    payload = [
         {
-            "id": v.id,
-            "url": v.url,
-            "title": v.title,
-            "source": v.source,
-            "duration": v.duration,
-            "thumbnail": v.thumbnail,
-            "channel": v.channel,
-            "status": v.status,
-            "created_at": v.created_at.isoformat() if v.created_at else None,
+            **dict(row),
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
         }
-        for v in videos
+        for row in result.mappings()
     ]
+    if is_default_page:
+        cache.set(VIDEOS_LIST, payload)
+    return not_modified(request, response, payload) or payload
 
 
 @router.post("/batch-delete")
-async def batch_delete_videos(req: BatchDeleteRequest, db: Session = Depends(get_db)):
+async def batch_delete_videos(req: BatchDeleteRequest, db: AsyncSession = Depends(get_db)):
     """Delete multiple videos and their files."""
-    deleted_count = 0
-    for vid in req.video_ids:
-        video = db.query(Video).filter(Video.id == vid).first()
-        if video:
-            if video.filename:
-                video_path = VIDEOS_DIR / video.filename
-                if video_path.exists():
-                    video_path.unlink()
-            db.delete(video)
-            deleted_count += 1
-    db.commit()
-    return {"success": True, "deleted_count": deleted_count}
+    rows = (await db.execute(
+        select(Video.id, Video.filename).where(Video.id.in_(req.video_ids))
+    )).all()
+    ids = [r.id for r in rows]
+    if not ids:
+        return {"success": True, "deleted_count": 0}
+
+    # Set-based deletes: child rows first since bulk DELETE skips ORM cascade
+    await db.execute(delete(Transcript).where(Transcript.video_id.in_(ids)))
+    await db.execute(delete(CollectionItem).where(CollectionItem.video_id.in_(ids)))
+    await db.execute(delete(Video).where(Video.id.in_(ids)))
+    await db.commit()
+    invalidate_videos()
+    # Dropping collection_items changes video_count in the collections list
+    invalidate_collections()
+
+    # Filesystem sweep off the event loop
+    filenames = [r.filename for r in rows if r.filename]
+    if filenames:
+        def _sweep():
+            for name in filenames:
+                (VIDEOS_DIR / name).unlink(missing_ok=True)
+        await asyncio.to_thread(_sweep)
+
+    return {"success": True, "deleted_count": len(ids)}
 
 
 @router.patch("/{video_id}")
-async def rename_video(video_id: str, req: RenameRequest, db: Session = Depends(get_db)):
+async def rename_video(video_id: str, req: RenameRequest, db: AsyncSession = Depends(get_db)):
     """Update a video's title."""
-    video = db.query(Video).filter(Video.id == video_id).first()
-    if not video:
+    # Core UPDATE ... RETURNING: one statement, no ORM load
+    row = (await db.execute(
+        update(Video)
+        .where(Video.id == video_id)
+        .values(title=req.title)
+        .returning(Video.id, Video.title)
+    )).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Video not found")
-    video.title = req.title
-    db.commit()
-    return {"success": True, "id": video.id, "title": video.title}
+    await db.commit()
+    invalidate_videos()
+    return {"success": True, "id": row.id, "title": row.title}
 
 
 @router.get("/{video_id}")
-async def get_video(video_id: str, db: Session = Depends(get_db)):
+async def get_video(video_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     """Get a single video with its transcript."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = await _get_video(db, video_id, with_transcript=True)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
@@ -256,7 +403,7 @@ async def get_video(video_id: str, db: Session = Depends(get_db)):
             "appreciation": video.transcript.appreciation,
         }
 
-    return {
+    payload = {
         "id": video.id,
         "url": video.url,
         "title": video.title,
@@ -269,30 +416,63 @@ async def get_video(video_id: str, db: Session = Depends(get_db)):
         "created_at": video.created_at.isoformat() if video.created_at else None,
         "transcript": transcript_data,
     }
+    return not_modified(request, response, payload) or payload
+
+
+@router.get("/{video_id}/stream")
+async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
+    """Hand the video file off to nginx via X-Accel-Redirect.
+
+    In prod nginx serves the bytes itself with sendfile::
+
+        location /videos/ { internal; alias /srv/reelscript/data/videos/; sendfile on; }
+
+    In dev the StaticFiles mount at /videos serves the same files, so the
+    frontend can keep using /videos/{filename} directly.
+    """
+    row = (await db.execute(
+        select(Video.filename).where(Video.id == video_id)
+    )).first()
+    if row is None or not row.filename:
+        raise HTTPException(status_code=404, detail="Video file not found")
+    return Response(
+        headers={"X-Accel-Redirect": f"/videos/{row.filename}"},
+        media_type="video/mp4",
+    )
 
 
 @router.delete("/{video_id}")
-async def delete_video(video_id: str, db: Session = Depends(get_db)):
+async def delete_video(video_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a video and its transcript."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = await _get_video(db, video_id, for_delete=True)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Delete video file
+    # Delete video file off the event loop
     if video.filename:
-        video_path = VIDEOS_DIR / video.filename
-        if video_path.exists():
-            video_path.unlink()
+        await remove_video_file(video.filename)
 
-    db.delete(video)
-    db.commit()
+    await db.delete(video)
+    await db.commit()
+    invalidate_videos()
+    # Cascaded collection_items change video_count in the collections list
+    invalidate_collections()
     return {"success": True}
 
 
 @router.post("/{video_id}/translate")
-async def translate_video(video_id: str, db: Session = Depends(get_db)):
-    """Translate transcript segments to Traditional Chinese."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+async def translate_video(
+    video_id: str,
+    summary: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+):
+    """Translate transcript segments to Traditional Chinese.
+
+    With summary=true the response carries only the segment count —
+    bot-style callers shouldn't have to download and parse thousands of
+    segments just to report success.
+    """
+    video = await _get_video(db, video_id, with_transcript=True)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
@@ -300,11 +480,13 @@ async def translate_video(video_id: str, db: Session = Depends(get_db)):
     if not transcript or not transcript.segments:
         raise HTTPException(status_code=400, detail="No transcript available")
 
-    # Check if already translated
-    has_translations = any(
+    # Check if already translated — timestamp first, legacy scan as fallback
+    if transcript.translated_at or any(
         seg.get("translation") for seg in transcript.segments
-    )
-    if has_translations:
+    ):
+        if summary:
+            return {"success": True, "message": "Already translated",
+                    "segment_count": len(transcript.segments)}
         return {"success": True, "message": "Already translated", "segments": transcript.segments}
 
     await manager.broadcast({
@@ -313,19 +495,30 @@ async def translate_video(video_id: str, db: Session = Depends(get_db)):
     })
 
     try:
-        loop = asyncio.get_running_loop()
-        translated = await loop.run_in_executor(
-            None, translate_segments, transcript.segments
-        )
+        # Identical transcripts (same content hash) reuse prior AI output
+        cache_key = f"ai:translate:{_content_hash(transcript)}"
+        translated = cache.get(cache_key)
+        if translated is None or len(translated) != len(transcript.segments):
+            loop = asyncio.get_running_loop()
+            translated = await loop.run_in_executor(
+                AI_POOL, translate_segments, transcript.segments
+            )
+            cache.set(cache_key, translated, ttl=3600)
 
         transcript.segments = translated
-        db.commit()
+        # translate_segments mutates the list in place, so this may be the
+        # same object the ORM already holds — force the column into the UPDATE
+        flag_modified(transcript, "segments")
+        transcript.translated_at = datetime.utcnow()
+        await db.commit()
 
         await manager.broadcast({
             "type": "translate_completed",
             "data": {"video_id": video_id},
         })
 
+        if summary:
+            return {"success": True, "segment_count": len(translated)}
         return {"success": True, "segments": translated}
     except Exception as e:
         await manager.broadcast({
@@ -337,9 +530,9 @@ async def translate_video(video_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{video_id}/analyze-vocabulary")
-async def analyze_video_vocabulary(video_id: str, db: Session = Depends(get_db)):
+async def analyze_video_vocabulary(video_id: str, db: AsyncSession = Depends(get_db)):
     """Analyze transcript segments for difficult vocabulary words."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = await _get_video(db, video_id, with_transcript=True)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
@@ -347,21 +540,28 @@ async def analyze_video_vocabulary(video_id: str, db: Session = Depends(get_db))
     if not transcript or not transcript.segments:
         raise HTTPException(status_code=400, detail="No transcript available")
 
-    # Check if already analyzed
-    has_vocab = any(
+    # Check if already analyzed — timestamp first, legacy scan as fallback
+    if transcript.analyzed_at or any(
         seg.get("vocabulary") for seg in transcript.segments
-    )
-    if has_vocab:
+    ):
         return {"success": True, "message": "Already analyzed", "segments": transcript.segments}
 
     try:
-        loop = asyncio.get_running_loop()
-        analyzed = await loop.run_in_executor(
-            None, analyze_segments, transcript.segments
-        )
+        cache_key = f"ai:vocab:{_content_hash(transcript)}"
+        analyzed = cache.get(cache_key)
+        if analyzed is None or len(analyzed) != len(transcript.segments):
+            loop = asyncio.get_running_loop()
+            analyzed = await loop.run_in_executor(
+                AI_POOL, analyze_segments, transcript.segments
+            )
+            cache.set(cache_key, analyzed, ttl=3600)
 
         transcript.segments = analyzed
-        db.commit()
+        # analyze_segments mutates the list in place — same-object
+        # reassignment alone would keep the column out of the UPDATE
+        flag_modified(transcript, "segments")
+        transcript.analyzed_at = datetime.utcnow()
+        await db.commit()
 
         return {"success": True, "segments": analyzed}
     except Exception as e:
@@ -370,9 +570,9 @@ async def analyze_video_vocabulary(video_id: str, db: Session = Depends(get_db))
 
 
 @router.post("/{video_id}/appreciate")
-async def appreciate_video(video_id: str, db: Session = Depends(get_db)):
+async def appreciate_video(video_id: str, db: AsyncSession = Depends(get_db)):
     """Generate content appreciation: theme, key points, golden quotes."""
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = await _get_video(db, video_id, with_transcript=True)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
@@ -381,19 +581,24 @@ async def appreciate_video(video_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="No transcript available")
 
     # Check if already analyzed (stored in appreciation field)
-    if transcript.appreciation and transcript.appreciation.get("theme"):
+    if transcript.appreciated_at or (
+        transcript.appreciation and transcript.appreciation.get("theme")
+    ):
         return {"success": True, "appreciation": transcript.appreciation}
 
     try:
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            None, generate_appreciation, transcript.full_text
-        )
+        cache_key = f"ai:appreciate:{_content_hash(transcript)}"
+        result = cache.get(cache_key)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                AI_POOL, generate_appreciation, transcript.full_text
+            )
+            cache.set(cache_key, result, ttl=3600)
 
         transcript.appreciation = result
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(transcript, "appreciation")
-        db.commit()
+        transcript.appreciated_at = datetime.utcnow()
+        await db.commit()
 
         return {"success": True, "appreciation": result}
     except Exception as e:
@@ -1,31 +1,81 @@
+import asyncio
+from typing import Optional, Set
+
+import orjson
 from fastapi import WebSocket
-from typing import List
+
+# A client that can't take a frame within this window is considered dead
+SEND_TIMEOUT = 1.0
 
 
 class ConnectionManager:
-    """WebSocket connection manager for real-time progress updates."""
+    """WebSocket connection manager for real-time progress updates.
+
+    Broadcasts are published to an internal queue and fanned out by a
+    single dispatcher task, so producers (pipeline, route handlers)
+    never wait on slow client sockets. This is also the seam where a
+    cross-process fanout (e.g. Redis pub/sub) would plug in if the app
+    ever runs more than one worker.
+    """
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Spawn the dispatcher task. Call once from app startup."""
+        if self._dispatcher is None:
+            self._queue = asyncio.Queue()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+            self._queue = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, message: dict):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        if self._queue is not None:
+            self._queue.put_nowait(message)
+        else:
+            # Dispatcher not running (startup/tests) — send inline
+            await self._fanout(message)
+
+    async def _dispatch(self):
+        while True:
+            message = await self._queue.get()
+            await self._fanout(message)
+
+    async def _fanout(self, message: dict):
+        # Serialize once per broadcast, not once per client. Text frames
+        # (not binary) so browser clients keep getting plain JSON strings.
+        if not self.active_connections:
+            return
+        payload = orjson.dumps(message).decode()
+        await asyncio.gather(
+            *(self._send(ws, payload) for ws in tuple(self.active_connections)),
+            return_exceptions=True,
+        )
 
-        for conn in disconnected:
-            self.disconnect(conn)
+    async def _send(self, websocket: WebSocket, payload: str):
+        # Sends run in parallel; one slow or dead socket can't stall the
+        # progress stream for everyone else.
+        try:
+            await asyncio.wait_for(websocket.send_text(payload), timeout=SEND_TIMEOUT)
+        except Exception:
+            self.disconnect(websocket)
 
 
 manager = ConnectionManager()
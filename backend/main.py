@@ -5,26 +5,49 @@ Download IG/YouTube videos, transcribe with Whisper, serve transcripts.
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from pathlib import Path
+import asyncio
+import logging
+import os
 
 from models import init_db
 from api.video_routes import router as video_router
 from api.collection_routes import router as collection_router
 from api.admin_routes import router as admin_router
 from api.websocket import manager
+from services.transcriber import transcriber
+from services.executors import TRANSCRIBE_POOL
+
+logger = logging.getLogger(__name__)
 
 DATA_DIR = Path("./data")
 VIDEOS_DIR = DATA_DIR / "videos"
 
 
+def _warmup_whisper():
+    try:
+        transcriber.warmup()
+    except Exception as e:
+        # Warmup is best-effort — the first real request loads the model lazily
+        logger.warning("Whisper warmup failed: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-    init_db()
+    await init_db()
+    manager.start()
+    # Prime the Whisper model (load + first-inference JIT) in the background
+    # so the first transcription request doesn't pay it. Set
+    # REELSCRIPT_WARMUP=0 to skip, e.g. during development.
+    if os.environ.get("REELSCRIPT_WARMUP") != "0":
+        asyncio.get_running_loop().run_in_executor(TRANSCRIBE_POOL, _warmup_whisper)
     yield
+    await manager.stop()
 
 
 app = FastAPI(
@@ -32,6 +55,7 @@ app = FastAPI(
     description="Personal video learning resource library",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -47,8 +71,10 @@ app.include_router(video_router)
 app.include_router(collection_router)
 app.include_router(admin_router)
 
-# Serve video files
-if VIDEOS_DIR.exists():
+# Serve video files. In prod nginx serves /videos/ itself with sendfile
+# (see the /api/videos/{id}/stream route for the X-Accel-Redirect path);
+# streaming MP4 bytes through Python is dev-only.
+if os.environ.get("REELSCRIPT_ENV") != "prod" and VIDEOS_DIR.exists():
     app.mount("/videos", StaticFiles(directory=str(VIDEOS_DIR)), name="videos")
 
 
@@ -59,7 +85,7 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text('{"type": "pong"}')
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -70,7 +96,21 @@ async def health():
 
 
 if __name__ == "__main__":
-    import os
+    import sys
     import uvicorn
     port = int(os.environ.get("REELSCRIPT_PORT", "8002"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools ship with uvicorn[standard]; pin the C event loop
+    # where it exists — uvloop has no Windows build, so the dev boxes
+    # running start.bat fall back to the default loop.
+    # workers > 1 needs the import string — but note the WS manager and
+    # TTL caches are in-process, so fan-out/invalidations don't cross
+    # workers; keep the default at 1 until that state moves out of process.
+    workers = int(os.environ.get("REELSCRIPT_WORKERS", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+    )
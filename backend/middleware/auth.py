@@ -4,6 +4,10 @@ Supports dual auth: JWT Bearer token OR legacy X-Admin-Key header.
 """
 
 import os
+import time
+from functools import lru_cache
+from hashlib import blake2b
+
 import jwt
 from fastapi import HTTPException, Request, Depends
 
@@ -13,6 +17,14 @@ ADMAN_APP_ID = os.environ.get("ADMAN_APP_ID", "app_yX0u0SiJ")
 LEGACY_ADMIN_KEY = os.environ.get("ADMIN_KEY", "reelscript-admin-2024")
 
 
+@lru_cache(maxsize=1024)
+def _decode_cached(token_hash: bytes, token: str) -> dict:
+    """Verify the HMAC signature once per token; repeat requests with the
+    same token become a dict lookup. Expiry is re-checked by the caller
+    because a cached entry can outlive its exp claim."""
+    return jwt.decode(token, ADMAN_APP_SECRET, algorithms=["HS256"])
+
+
 def get_current_user(request: Request) -> dict:
     """Extract and verify user from adman JWT in Authorization header."""
     auth_header = request.headers.get("Authorization", "")
@@ -21,12 +33,17 @@ def get_current_user(request: Request) -> dict:
 
     token = auth_header[7:]
     try:
-        payload = jwt.decode(token, ADMAN_APP_SECRET, algorithms=["HS256"])
+        token_hash = blake2b(token.encode(), digest_size=16).digest()
+        payload = _decode_cached(token_hash, token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    exp = payload.get("exp")
+    if exp is not None and exp < time.time():
+        raise HTTPException(status_code=401, detail="Token expired")
+
     if payload.get("app") != ADMAN_APP_ID:
         raise HTTPException(status_code=401, detail="Invalid app")
 
@@ -1 +1 @@
-from .database import init_db, get_db, Base, Video, Transcript, Collection, CollectionItem
+from .database import init_db, get_db, uuid7, Base, Video, Transcript, Collection, CollectionItem
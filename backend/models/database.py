@@ -1,20 +1,99 @@
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Integer, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, Text, Integer, Float, Boolean, ForeignKey, JSON, Index, LargeBinary, TypeDecorator, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import relationship
 from datetime import datetime
+import os
+import time
 import uuid
+import zlib
 
-DATABASE_URL = "sqlite:///./data/reelscript.db"
+import orjson
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DATABASE_URL = "sqlite+aiosqlite:///./data/reelscript.db"
+
+engine = create_async_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    max_overflow=20,
+    insertmanyvalues_page_size=1000,
+)
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run concurrently with the single writer;
+    the rest trade a little durability for commit throughput."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def uuid7() -> str:
+    """Time-ordered UUIDv7 (RFC 9562) as the usual 36-char string.
+
+    Random v4 keys land all over the PK B-tree; a millisecond timestamp
+    prefix keeps inserts append-mostly, so pages split less and recent
+    rows cluster together. API consumers treat ids as opaque strings, so
+    the format change is invisible to them.
+    """
+    ms = time.time_ns() // 1_000_000
+    b = bytearray(ms.to_bytes(6, "big") + os.urandom(10))
+    b[6] = (b[6] & 0x0F) | 0x70  # version 7
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(b)))
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as a zlib-compressed blob.
+
+    Transcript segments repeat the same short keys hundreds of times, so
+    compression cuts row size ~5x — less I/O on every read and rewrite.
+    Rows written before this type existed come back as plain JSON text
+    and are handled transparently.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(orjson.dumps(value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (bytes, memoryview)):
+            try:
+                return orjson.loads(zlib.decompress(bytes(value)))
+            except zlib.error:
+                # Legacy uncompressed row stored as raw bytes
+                return orjson.loads(bytes(value))
+        # Legacy row stored as JSON text
+        return orjson.loads(value)
+
+
 class Video(Base):
     __tablename__ = "videos"
-
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (
+        Index("ix_videos_url", "url", unique=True),
+        # Admin filters always sort by created_at DESC, so pair each filter
+        # column with created_at for an index-only ordered scan
+        Index("ix_videos_status_created", "status", "created_at"),
+        Index("ix_videos_category_created", "category", "created_at"),
+        Index("ix_videos_featured_created", "is_featured", "created_at"),
+    )
+
+    id = Column(String, primary_key=True, default=uuid7)
     url = Column(Text, nullable=False)
     title = Column(String, nullable=True)
     source = Column(String, default="unknown")  # ig, youtube
@@ -36,12 +115,16 @@ class Video(Base):
 class Transcript(Base):
     __tablename__ = "transcripts"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=uuid7)
     video_id = Column(String, ForeignKey("videos.id"), nullable=False, unique=True)
     language = Column(String, default="en")
-    segments = Column(JSON, nullable=True)  # [{index, start, end, text, translation}]
+    segments = Column(CompressedJSON, nullable=True)  # [{index, start, end, text, translation}]
     full_text = Column(Text, nullable=True)  # plain text version
-    appreciation = Column(JSON, nullable=True)  # {theme, keyPoints, goldenQuotes}
+    appreciation = Column(CompressedJSON, nullable=True)  # {theme, keyPoints, goldenQuotes}
+    content_hash = Column(String, nullable=True)  # sha256(full_text), keys AI result caching
+    translated_at = Column(DateTime, nullable=True)
+    analyzed_at = Column(DateTime, nullable=True)  # vocabulary analysis
+    appreciated_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     video = relationship("Video", back_populates="transcript")
@@ -50,7 +133,7 @@ class Transcript(Base):
 class Collection(Base):
     __tablename__ = "collections"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=uuid7)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -61,9 +144,9 @@ class Collection(Base):
 class CollectionItem(Base):
     __tablename__ = "collection_items"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    collection_id = Column(String, ForeignKey("collections.id"), nullable=False)
-    video_id = Column(String, ForeignKey("videos.id"), nullable=False)
+    id = Column(String, primary_key=True, default=uuid7)
+    collection_id = Column(String, ForeignKey("collections.id"), nullable=False, index=True)
+    video_id = Column(String, ForeignKey("videos.id"), nullable=False, index=True)
     notes = Column(Text, nullable=True)
     added_at = Column(DateTime, default=datetime.utcnow)
 
@@ -71,28 +154,46 @@ class CollectionItem(Base):
     video = relationship("Video", back_populates="collection_items")
 
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
-    # Migrate: add missing columns
-    with engine.connect() as conn:
-        from sqlalchemy import text, inspect
-        inspector = inspect(engine)
-        transcript_cols = [c["name"] for c in inspector.get_columns("transcripts")]
-        if "appreciation" not in transcript_cols:
-            conn.execute(text("ALTER TABLE transcripts ADD COLUMN appreciation JSON"))
-            conn.commit()
-        video_cols = [c["name"] for c in inspector.get_columns("videos")]
-        if "category" not in video_cols:
-            conn.execute(text("ALTER TABLE videos ADD COLUMN category VARCHAR"))
-            conn.commit()
-        if "is_featured" not in video_cols:
-            conn.execute(text("ALTER TABLE videos ADD COLUMN is_featured BOOLEAN DEFAULT 0"))
-            conn.commit()
-
-
-def get_db():
-    db = SessionLocal()
-    try:
+_MIGRATIONS = [
+    "ALTER TABLE transcripts ADD COLUMN appreciation JSON",
+    "ALTER TABLE transcripts ADD COLUMN content_hash VARCHAR",
+    "ALTER TABLE transcripts ADD COLUMN translated_at DATETIME",
+    "ALTER TABLE transcripts ADD COLUMN analyzed_at DATETIME",
+    "ALTER TABLE transcripts ADD COLUMN appreciated_at DATETIME",
+    "ALTER TABLE videos ADD COLUMN category VARCHAR",
+    "ALTER TABLE videos ADD COLUMN is_featured BOOLEAN DEFAULT 0",
+]
+
+
+def _migrate(conn):
+    """Add columns introduced after the initial schema (sync, via run_sync).
+
+    SQLite's canonical idempotent ALTER: just try it and swallow the
+    "duplicate column" error — no table reflection round trip.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    for ddl in _MIGRATIONS:
+        try:
+            conn.execute(text(ddl))
+        except OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+    # Indexes added after the initial schema (create_all skips existing tables)
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_videos_url ON videos (url)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_videos_status_created ON videos (status, created_at)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_videos_category_created ON videos (category, created_at)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_videos_featured_created ON videos (is_featured, created_at)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_collection_items_collection_id ON collection_items (collection_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_collection_items_video_id ON collection_items (video_id)"))
+
+
+async def init_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_migrate)
+
+
+async def get_db() -> AsyncSession:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,116 @@
+"""
+Fused AI analysis — title, appreciation, per-segment translations, and
+vocabulary in ONE LLM call, instead of four separate round trips over
+the same transcript.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import orjson
+
+from services.llm import call_llm
+from services.util import parse_json_object
+
+# Same transcript -> same fused analysis; re-processing skips the LLM
+# round trip. Keyed by prompt + system prompt so a prompt change
+# invalidates old entries (cf. cache/whisper, cache/vocab).
+CACHE_DIR = Path("cache/analysis")
+
+SYSTEM_PROMPT = """You are a bilingual content analyst and translator for Chinese-speaking English learners.
+Input is a JSON object: {"full_text": "...", "segments": ["...", "..."]} from a video transcript.
+Produce ONE JSON object:
+
+{
+  "title": "簡短繁體中文標題 (max 20 chars)",
+  "theme": "一句話描述主題 (繁體中文)",
+  "keyPoints": ["重點1", "重點2", "重點3"],
+  "goldenQuotes": [
+    {"en": "Original English quote", "zh": "繁體中文翻譯"},
+    {"en": "...", "zh": "..."},
+    {"en": "...", "zh": "..."}
+  ],
+  "translations": ["每段的繁體中文翻譯", "..."],
+  "vocabulary": [[{"word": "phrase as it appears", "translation": "繁體中文"}], []]
+}
+
+Rules:
+- title: max 20 characters, 繁體中文, specific not generic
+- theme: 1 sentence in 繁體中文
+- keyPoints: exactly 3 bullet points in 繁體中文
+- goldenQuotes: exactly 3 memorable sentences from the original English, with 繁體中文 translation
+- translations: EXACTLY one natural 繁體中文 translation per input segment, same order
+- vocabulary: EXACTLY one array per input segment; prioritize phrasal verbs, idioms,
+  collocations; skip basic words; 0-2 items per segment; empty array if nothing notable
+- Use 繁體中文, NOT 簡體
+- Output ONLY valid JSON, no markdown fences or extra text"""
+
+PROVIDERS = ["openai", "deepseek", "groq"]
+
+
+def _cache_path(prompt: str) -> Path:
+    key = hashlib.sha1((SYSTEM_PROMPT + prompt).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def analyze_full(full_text: str, segment_texts: list[str]) -> dict:
+    """One AI call for everything. Returns {title, theme, keyPoints,
+    goldenQuotes, translations, vocabulary}; missing keys mean the
+    provider skipped them and callers should fall back per-field."""
+    prompt = json.dumps(
+        {"full_text": full_text, "segments": segment_texts},
+        ensure_ascii=False,
+    )
+
+    cache_path = _cache_path(prompt)
+    if cache_path.exists():
+        try:
+            result = orjson.loads(cache_path.read_bytes())
+            print(f"[AI] Cache hit: {result.get('title')}")
+            return result
+        except orjson.JSONDecodeError:
+            pass  # corrupt entry — regenerate
+
+    print(f"[AI] Full analysis ({len(full_text)} chars, {len(segment_texts)} segments)...")
+
+    # call_llm brings retry with backoff and the per-provider circuit
+    # breaker to the hottest LLM call in the pipeline
+    try:
+        response = call_llm(prompt, PROVIDERS, system=SYSTEM_PROMPT,
+                            temperature=0.3, tag="AI")
+    except Exception as e:
+        print(f"[AI] All providers failed: {e}")
+        return {}
+
+    result = parse_json_object(response)
+    if result and result.get("title"):
+        result = _normalize(result, len(segment_texts))
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(orjson.dumps(result))
+        return result
+
+    print(f"[AI] Unusable response; preview: {response.strip()[:200]}")
+    return {}
+
+
+def _normalize(result: dict, segment_count: int) -> dict:
+    """Pad/truncate the per-segment arrays so they always align."""
+    translations = result.get("translations")
+    if isinstance(translations, list):
+        translations = [str(t) for t in translations]
+        while len(translations) < segment_count:
+            translations.append("")
+        result["translations"] = translations[:segment_count]
+    else:
+        result.pop("translations", None)
+
+    vocabulary = result.get("vocabulary")
+    if isinstance(vocabulary, list):
+        while len(vocabulary) < segment_count:
+            vocabulary.append([])
+        result["vocabulary"] = vocabulary[:segment_count]
+    else:
+        result.pop("vocabulary", None)
+
+    return result
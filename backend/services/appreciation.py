@@ -2,14 +2,8 @@
 Content appreciation service — generate theme, key takeaways, and golden quotes.
 """
 
-import sys
-import json
-
-MEEI_PATH = "C:/Users/jeffb/Desktop/code/meei/python/src"
-if MEEI_PATH not in sys.path:
-    sys.path.insert(0, MEEI_PATH)
-
-from meei.chat import chat  # noqa: E402
+from services.llm import call_llm
+from services.util import parse_json_object
 
 SYSTEM_PROMPT = """You are a bilingual content analyst. Given an English text (from a video transcript),
 produce a concise study summary in the following JSON format:
@@ -35,15 +29,8 @@ PROVIDERS = ["openai", "groq"]
 
 
 def _call_llm(prompt: str) -> str:
-    last_error = None
-    for pv in PROVIDERS:
-        try:
-            return chat.ask(prompt, pv=pv, system=SYSTEM_PROMPT, temperature=0.3)
-        except Exception as e:
-            last_error = e
-            print(f"[Appreciation] {pv} failed: {e}, trying next...")
-            continue
-    raise RuntimeError(f"All providers failed. Last error: {last_error}")
+    return call_llm(prompt, PROVIDERS, system=SYSTEM_PROMPT, temperature=0.3,
+                    tag="Appreciation")
 
 
 def generate_appreciation(full_text: str) -> dict:
@@ -51,31 +38,11 @@ def generate_appreciation(full_text: str) -> dict:
     print(f"[Appreciation] Analyzing text ({len(full_text)} chars)...")
     response = _call_llm(full_text)
 
-    text = response.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
-
-    try:
-        result = json.loads(text)
-        if isinstance(result, dict) and "theme" in result:
-            return result
-    except json.JSONDecodeError:
-        pass
-
-    # Try to find JSON object
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1:
-        try:
-            result = json.loads(text[start:end + 1])
-            if isinstance(result, dict) and "theme" in result:
-                return result
-        except json.JSONDecodeError:
-            pass
+    result = parse_json_object(response)
+    if result is not None and "theme" in result:
+        return result
 
-    print(f"[Appreciation] Warning: failed to parse response: {text[:200]}")
+    print(f"[Appreciation] Warning: failed to parse response: {response.strip()[:200]}")
     return {
         "theme": "",
         "keyPoints": [],
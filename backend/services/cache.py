@@ -0,0 +1,56 @@
+"""
+In-process TTL cache for hot read endpoints (stats, lists).
+Write endpoints invalidate the affected keys so readers never see
+stale data for longer than one TTL window.
+"""
+
+import time
+from typing import Any, Optional
+
+# Shared key names so routes and invalidation stay in sync
+ADMIN_STATS = "admin:stats"
+VIDEOS_LIST = "videos:list"
+COLLECTIONS_LIST = "collections:list"
+
+DEFAULT_TTL = 30.0  # seconds
+
+
+class TTLCache:
+    """Tiny dict-backed cache with per-key expiry."""
+
+    def __init__(self):
+        self._store: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._store.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float = DEFAULT_TTL) -> None:
+        self._store[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# Singleton
+cache = TTLCache()
+
+
+def invalidate_videos() -> None:
+    """Call after any write that changes video rows."""
+    cache.delete(VIDEOS_LIST, ADMIN_STATS)
+
+
+def invalidate_collections() -> None:
+    """Call after any write that changes collection rows."""
+    cache.delete(COLLECTIONS_LIST, ADMIN_STATS)
@@ -7,7 +7,6 @@ import asyncio
 import json
 import logging
 import re
-import subprocess
 from pathlib import Path
 from typing import Dict, Any
 
@@ -22,11 +21,21 @@ VIDEOS_DIR = Path("./data/videos")
 VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+async def remove_video_file(filename: str) -> None:
+    """Unlink a downloaded file without blocking the event loop."""
+    await asyncio.to_thread(lambda: (VIDEOS_DIR / filename).unlink(missing_ok=True))
+
+
+# Compiled once — _detect_source runs on every ingest request
+_IG_RE = re.compile(r"instagram\.com|instagr\.am", re.I)
+_YT_RE = re.compile(r"youtube\.com|youtu\.be", re.I)
+
+
 def _detect_source(url: str) -> str:
     """Detect video source from URL."""
-    if re.search(r"instagram\.com|instagr\.am", url):
+    if _IG_RE.search(url):
         return "ig"
-    if re.search(r"youtube\.com|youtu\.be", url):
+    if _YT_RE.search(url):
         return "youtube"
     return "unknown"
 
@@ -55,46 +64,104 @@ async def get_video_info(url: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
-def _ensure_h264(filepath: Path) -> None:
-    """Re-encode video to H.264 if needed for iOS/mobile compatibility."""
+async def _run_subprocess(cmd: list, timeout: float) -> bytes:
+    """Run a command without tying up a thread-pool worker; returns stdout."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
     try:
-        result = subprocess.run(
-            ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams", str(filepath)],
-            capture_output=True, text=True, timeout=30,
-        )
-        info = json.loads(result.stdout)
-        video_codec = next(
-            (s["codec_name"] for s in info["streams"] if s["codec_type"] == "video"),
-            None,
-        )
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace")[-500:])
+    return stdout
+
+
+# Hardware H.264 encoders run several times faster than libx264 for the
+# short clips we handle; probed once on first re-encode.
+_ENCODER_PREFERENCE = ["h264_nvenc", "h264_qsv", "h264_videotoolbox", "libx264"]
+_encoder: str | None = None
+
+
+async def _pick_encoder() -> str:
+    global _encoder
+    if _encoder is None:
+        try:
+            out = await _run_subprocess(["ffmpeg", "-hide_banner", "-encoders"], timeout=15)
+            available = out.decode(errors="replace")
+            _encoder = next((e for e in _ENCODER_PREFERENCE if e in available), "libx264")
+        except Exception:
+            _encoder = "libx264"
+        logger.info(f"[Downloader] Using H.264 encoder: {_encoder}")
+    return _encoder
+
+
+async def _probe_video_codec(filepath: Path) -> str | None:
+    stdout = await _run_subprocess(
+        ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams", str(filepath)],
+        timeout=30,
+    )
+    info = json.loads(stdout)
+    return next(
+        (s["codec_name"] for s in info["streams"] if s["codec_type"] == "video"),
+        None,
+    )
+
+
+async def _ensure_h264(filepath: Path, known_codec: str | None = None) -> None:
+    """Re-encode video to H.264 if needed for iOS/mobile compatibility.
+
+    When yt-dlp already reported the stream codec, trust it and skip the
+    ffprobe round trip. Subprocesses run via the asyncio subprocess API
+    so long re-encodes don't occupy a thread-pool worker.
+    """
+    try:
+        if known_codec and known_codec.startswith(("avc1", "h264")):
+            video_codec = "h264"
+        else:
+            video_codec = await _probe_video_codec(filepath)
 
         if video_codec == "h264":
             logger.info(f"[Downloader] {filepath.name} already H.264, applying faststart...")
             tmp = filepath.with_suffix(".tmp.mp4")
-            subprocess.run(
+            await _run_subprocess(
                 [
                     "ffmpeg", "-i", str(filepath),
                     "-c:v", "copy", "-c:a", "copy",
                     "-movflags", "+faststart", "-y", str(tmp),
                 ],
-                capture_output=True, timeout=120, check=True,
+                timeout=120,
             )
             filepath.unlink()
             tmp.rename(filepath)
             return
 
         logger.info(f"[Downloader] Re-encoding {filepath.name} from {video_codec} to H.264...")
+        encoder = await _pick_encoder()
+        if encoder == "libx264":
+            # Compatibility-only pass — trade compression for wall time
+            codec_args = [
+                "-c:v", "libx264", "-profile:v", "main", "-level", "3.1",
+                "-crf", "28", "-preset", "ultrafast", "-threads", "0",
+            ]
+        elif encoder == "h264_nvenc":
+            codec_args = ["-c:v", encoder, "-preset", "p4", "-b:v", "2M"]
+        else:
+            codec_args = ["-c:v", encoder, "-b:v", "2M"]
         tmp = filepath.with_suffix(".tmp.mp4")
-        subprocess.run(
+        await _run_subprocess(
             [
                 "ffmpeg", "-i", str(filepath),
-                "-c:v", "libx264", "-profile:v", "main", "-level", "3.1",
-                "-crf", "23", "-preset", "fast",
+                *codec_args,
                 "-c:a", "aac", "-b:a", "128k",
                 "-movflags", "+faststart",
                 "-y", str(tmp),
             ],
-            capture_output=True, timeout=600, check=True,
+            timeout=600,
         )
         filepath.unlink()
         tmp.rename(filepath)
@@ -120,6 +187,19 @@ async def download_video(url: str, video_id: str) -> Dict[str, Any]:
     """
     source = _detect_source(url)
 
+    # yt-dlp invokes progress_hooks from its own download thread, where
+    # there is no running event loop — hand payloads to the loop via
+    # call_soon_threadsafe and let one consumer coalesce them, so a burst
+    # of ~10 ticks/sec becomes at most ~5 broadcasts/sec.
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    def _enqueue(payload: Dict[str, Any]):
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            pass  # drop — the next tick supersedes this one anyway
+
     def progress_hook(d: Dict[str, Any]):
         if d["status"] == "downloading":
             percent_str = d.get("_percent_str", "0%").strip()
@@ -127,33 +207,48 @@ async def download_video(url: str, video_id: str) -> Dict[str, Any]:
                 percent = float(percent_str.replace("%", ""))
             except (ValueError, AttributeError):
                 percent = 0
-
-            asyncio.create_task(manager.broadcast({
-                "type": "download_progress",
-                "data": {
-                    "video_id": video_id,
-                    "progress": percent,
-                    "speed": d.get("_speed_str", ""),
-                },
-            }))
-
+            payload = {
+                "video_id": video_id,
+                "progress": percent,
+                "speed": d.get("_speed_str", ""),
+            }
         elif d["status"] == "finished":
-            asyncio.create_task(manager.broadcast({
-                "type": "download_progress",
-                "data": {
-                    "video_id": video_id,
-                    "progress": 100,
-                    "status": "processing",
-                },
-            }))
+            payload = {"video_id": video_id, "progress": 100, "status": "processing"}
+        else:
+            return
+        loop.call_soon_threadsafe(_enqueue, payload)
+
+    async def _drain():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            await asyncio.sleep(0.2)  # let the burst accumulate
+            done = False
+            while not queue.empty():
+                nxt = queue.get_nowait()
+                if nxt is None:
+                    done = True
+                else:
+                    item = nxt
+            await manager.broadcast({"type": "download_progress", "data": item})
+            if done:
+                return
 
     ydl_opts = {
         "outtmpl": str(VIDEOS_DIR / "%(id)s.%(ext)s"),
         "progress_hooks": [progress_hook],
         "quiet": True,
         "no_warnings": True,
-        "format": "bestvideo[vcodec^=avc1][ext=mp4]+bestaudio[ext=m4a]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
+        # 720p is plenty for a mobile transcription workflow; preferring
+        # avc1 also lets _ensure_h264 skip the whole re-encode pass
+        "format": (
+            "bestvideo[vcodec^=avc1][height<=720][ext=mp4]+bestaudio[ext=m4a]"
+            "/bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]"
+            "/best[height<=720][ext=mp4]/best"
+        ),
         "merge_output_format": "mp4",
+        "concurrent_fragment_downloads": 5,
     }
 
     try:
@@ -162,14 +257,22 @@ async def download_video(url: str, video_id: str) -> Dict[str, Any]:
             "data": {"video_id": video_id, "url": url},
         })
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            filename = ydl.prepare_filename(info)
+        def _download():
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=True)
+                return info, ydl.prepare_filename(info)
+
+        drain_task = asyncio.create_task(_drain())
+        try:
+            info, filename = await asyncio.to_thread(_download)
+        finally:
+            await queue.put(None)
+            await drain_task
 
         # Ensure H.264 codec for iOS/mobile compatibility
         filepath = Path(filename)
         if filepath.exists():
-            await asyncio.to_thread(_ensure_h264, filepath)
+            await _ensure_h264(filepath, info.get("vcodec"))
 
         result = {
             "success": True,
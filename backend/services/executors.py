@@ -0,0 +1,13 @@
+"""
+Dedicated thread pools for blocking work, so CPU-heavy transcription
+can't starve the shared default executor that asyncio hands everything.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Whisper saturates the cores on its own; one job at a time avoids
+# thrashing and keeps transcription latency predictable
+TRANSCRIBE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcribe")
+
+# LLM calls are network-bound; a small pool bounds concurrent requests
+AI_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ai")
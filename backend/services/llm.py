@@ -0,0 +1,112 @@
+"""
+Shared LLM dispatch — provider fallback with a small circuit breaker.
+
+After a few consecutive failures a provider is skipped for a cooldown
+window instead of costing a full request timeout on every call while it
+is down. State is per-process, which matches the single-worker app.
+"""
+
+import os
+import random
+import sys
+import time
+
+import httpx
+
+# Default for the dev box; override with MEEI_PATH in the environment
+MEEI_PATH = os.environ.get("MEEI_PATH", "C:/Users/jeffb/Desktop/code/meei/python/src")
+
+_chat = None
+
+
+def get_chat():
+    """Import the meei SDK on first use, not at module import.
+
+    Keeps sys.path untouched and cold start cheap for code paths (and
+    whole processes) that never reach an LLM call.
+    """
+    global _chat
+    if _chat is None:
+        if MEEI_PATH and MEEI_PATH not in sys.path:
+            sys.path.insert(0, MEEI_PATH)
+        from meei.chat import chat
+        _chat = chat
+    return _chat
+
+_FAILURE_THRESHOLD = 3
+_OPEN_SECONDS = 60.0
+# Transient errors retry the same provider (with jittered backoff)
+# before failing over — a blip shouldn't cost a full provider switch
+_MAX_ATTEMPTS = 2
+_MAX_BACKOFF = 8.0
+
+# provider -> (consecutive failures, skip-until monotonic timestamp)
+_provider_state: dict[str, tuple[int, float]] = {}
+
+
+def _available(pv: str) -> bool:
+    _, until = _provider_state.get(pv, (0, 0.0))
+    return time.monotonic() >= until
+
+
+def _record_failure(pv: str) -> None:
+    fails, _ = _provider_state.get(pv, (0, 0.0))
+    fails += 1
+    until = time.monotonic() + _OPEN_SECONDS if fails >= _FAILURE_THRESHOLD else 0.0
+    _provider_state[pv] = (fails, until)
+
+
+def _record_success(pv: str) -> None:
+    _provider_state.pop(pv, None)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, (httpx.TransportError, httpx.TimeoutException)):
+        return True
+    msg = str(exc).lower()
+    return "429" in msg or "timeout" in msg or "rate limit" in msg
+
+
+def _backoff_delay(exc: Exception, attempt: int) -> float:
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_BACKOFF)
+        except ValueError:
+            pass
+    return min(2 ** attempt + random.random(), _MAX_BACKOFF)
+
+
+def call_llm(prompt: str, providers: list[str], system: str | None = None,
+             temperature: float = 0.3, tag: str = "LLM") -> str:
+    """Ask providers in order, skipping any whose breaker is open.
+
+    If every breaker is open, tries them all anyway (half-open probe)
+    rather than failing without a single attempt.
+    """
+    last_error = None
+    attempted = False
+    for respect_breaker in (True, False):
+        for pv in providers:
+            if respect_breaker and not _available(pv):
+                continue
+            attempted = True
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    response = get_chat().ask(prompt, pv=pv, system=system, temperature=temperature)
+                    _record_success(pv)
+                    return response
+                except Exception as e:
+                    last_error = e
+                    if attempt + 1 < _MAX_ATTEMPTS and _is_transient(e):
+                        delay = _backoff_delay(e, attempt)
+                        print(f"[{tag}] {pv} transient error: {e}, retrying in {delay:.1f}s...")
+                        time.sleep(delay)
+                        continue
+                    _record_failure(pv)
+                    print(f"[{tag}] {pv} failed: {e}, trying next...")
+                    break
+        if attempted:
+            break
+    raise RuntimeError(f"All providers failed. Last error: {last_error}")
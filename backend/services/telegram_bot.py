@@ -10,6 +10,9 @@ Setup:
 import os
 import asyncio
 import logging
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -24,20 +27,77 @@ logger = logging.getLogger(__name__)
 REELSCRIPT_API = os.getenv("REELSCRIPT_API", "http://localhost:8002")
 REELSCRIPT_WEB = os.getenv("REELSCRIPT_WEB", "http://localhost:5173")
 
+# One client for every handler — keep-alive connections to the API
+# instead of a fresh pool (DNS + TCP handshake) per Telegram message
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        # connect=5 fails fast when the API is down instead of hogging the
+        # pool for the full read window; HTTP/2 multiplexes concurrent
+        # commands over fewer sockets
+        _client = httpx.AsyncClient(
+            base_url=REELSCRIPT_API,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0, pool=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def _close_client(app) -> None:
+    if _client is not None:
+        await _client.aclose()
+
+
+# Short-lived cache of GET /api/videos — /list plus any /translate /vocab
+# /study burst would otherwise each pay a full round trip
+_VIDEOS_TTL = 5.0
+_videos_cache: tuple[float, list] | None = None
+# 8-char id prefix (what /list shows) -> matching videos, rebuilt with the cache
+_prefix_index: dict[str, list] = {}
+
+
+async def _get_videos() -> list:
+    global _videos_cache, _prefix_index
+    if _videos_cache is not None and time.monotonic() - _videos_cache[0] < _VIDEOS_TTL:
+        return _videos_cache[1]
+    resp = await _get_client().get("/api/videos", timeout=10)
+    resp.raise_for_status()
+    videos = resp.json()
+    index: dict[str, list] = {}
+    for v in videos:
+        index.setdefault(v["id"][:8], []).append(v)
+    _videos_cache = (time.monotonic(), videos)
+    _prefix_index = index
+    return videos
 
-def _get_allowed_users() -> set[int]:
+
+def _invalidate_videos() -> None:
+    global _videos_cache
+    _videos_cache = None
+
+
+@lru_cache(maxsize=1)
+def _get_allowed_users() -> frozenset[int]:
+    """Parsed once — the env doesn't change while the bot is running."""
     raw = os.getenv("TELEGRAM_ALLOWED_USERS", "")
     if not raw.strip():
-        return set()
-    return {int(uid.strip()) for uid in raw.split(",") if uid.strip()}
+        return frozenset()
+    return frozenset(int(uid.strip()) for uid in raw.split(",") if uid.strip())
+
+
+# One compiled alternation, case-insensitive — a single scan over the
+# message instead of four substring passes over a lowered copy
+_VIDEO_URL_RE = re.compile(
+    r"youtube\.com/|youtu\.be/|instagram\.com/reel|instagram\.com/p/", re.I
+)
 
 
 def _is_video_url(text: str) -> bool:
-    patterns = [
-        "youtube.com/", "youtu.be/",
-        "instagram.com/reel", "instagram.com/p/",
-    ]
-    return any(p in text.lower() for p in patterns)
+    return _VIDEO_URL_RE.search(text) is not None
 
 
 def _check_auth(update: Update) -> bool:
@@ -67,15 +127,18 @@ async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def cmd_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(f"{REELSCRIPT_API}/api/videos")
-        resp.raise_for_status()
-        videos = resp.json()
+    videos = await _get_videos()
 
     if not videos:
         await update.message.reply_text("還沒有影片，傳個連結給我吧！")
         return
 
+    # Remember short -> full id for this user so follow-up commands using
+    # IDs from this list resolve without another /api/videos round trip
+    id_map = context.user_data.setdefault("id_map", {})
+    for v in videos:
+        id_map[v["id"][:8]] = v["id"]
+
     lines = []
     for i, v in enumerate(videos[:15], 1):
         status_icon = {
@@ -102,13 +165,21 @@ async def _get_video_id(context: ContextTypes.DEFAULT_TYPE, update: Update) -> s
 
     short_id = context.args[0].strip()
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(f"{REELSCRIPT_API}/api/videos")
-        resp.raise_for_status()
-        videos = resp.json()
+    # IDs already resolved for this user via /list skip the API entirely
+    if len(short_id) == 8:
+        full_id = context.user_data.get("id_map", {}).get(short_id)
+        if full_id:
+            return full_id
 
-    # Match by prefix
-    matches = [v for v in videos if v["id"].startswith(short_id)]
+    videos = await _get_videos()
+
+    # Match by prefix — the index covers the 8-char ids /list hands out;
+    # shorter prefixes fall back to a full scan
+    if len(short_id) >= 8:
+        shortlist = _prefix_index.get(short_id[:8], [])
+        matches = [v for v in shortlist if v["id"].startswith(short_id)]
+    else:
+        matches = [v for v in videos if v["id"].startswith(short_id)]
     if len(matches) == 1:
         return matches[0]["id"]
     elif len(matches) > 1:
@@ -132,16 +203,25 @@ async def cmd_translate(update: Update, context: ContextTypes.DEFAULT_TYPE):
     msg = await update.message.reply_text("🔄 翻譯中...")
 
     try:
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(f"{REELSCRIPT_API}/api/videos/{video_id}/translate")
-            resp.raise_for_status()
-            data = resp.json()
+        # summary=true: only the count comes back, not thousands of segments
+        resp = await asyncio.wait_for(
+            _get_client().post(
+                f"/api/videos/{video_id}/translate",
+                params={"summary": "true"},
+                timeout=httpx.Timeout(120.0, connect=5.0, write=30.0, pool=5.0),
+            ),
+            timeout=150,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         if data.get("message") == "Already translated":
             await msg.edit_text("✅ 已翻譯過了！")
         else:
-            seg_count = len(data.get("segments", []))
+            seg_count = data.get("segment_count") or len(data.get("segments", []))
             await msg.edit_text(f"✅ 翻譯完成！共 {seg_count} 段")
+    except asyncio.TimeoutError:
+        await msg.edit_text("⏰ 翻譯超時，請稍後用 /list 確認狀態")
     except Exception as e:
         logger.error(f"Translation failed: {e}")
         await msg.edit_text(f"❌ 翻譯失敗：{e}")
@@ -159,27 +239,37 @@ async def cmd_vocab(update: Update, context: ContextTypes.DEFAULT_TYPE):
     msg = await update.message.reply_text("🔄 分析單字中...")
 
     try:
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(f"{REELSCRIPT_API}/api/videos/{video_id}/analyze-vocabulary")
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await asyncio.wait_for(
+            _get_client().post(
+                f"/api/videos/{video_id}/analyze-vocabulary",
+                timeout=httpx.Timeout(120.0, connect=5.0, write=30.0, pool=5.0),
+            ),
+            timeout=150,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         if data.get("message") == "Already analyzed":
             await msg.edit_text("✅ 已分析過了！")
         else:
-            # Show a preview of vocabulary
+            # Show a preview of vocabulary — set-based dedupe, O(1) per word
             segments = data.get("segments", [])
+            seen = set()
             words = []
             for seg in segments:
                 for v in seg.get("vocabulary", []):
-                    if v["word"] not in [w[0] for w in words]:
-                        words.append((v["word"], v["translation"]))
+                    w = v["word"]
+                    if w not in seen:
+                        seen.add(w)
+                        words.append((w, v["translation"]))
             preview = "\n".join(f"  • {w} — {t}" for w, t in words[:10])
             remaining = len(words) - 10
             text = f"✅ 單字分析完成！\n\n{preview}"
             if remaining > 0:
                 text += f"\n  ...還有 {remaining} 個"
             await msg.edit_text(text)
+    except asyncio.TimeoutError:
+        await msg.edit_text("⏰ 分析超時，請稍後再試")
     except Exception as e:
         logger.error(f"Vocabulary analysis failed: {e}")
         await msg.edit_text(f"❌ 分析失敗：{e}")
@@ -205,11 +295,10 @@ async def _poll_and_notify(chat_id: int, video_id: str, title: str, bot):
     for _ in range(max_polls):
         await asyncio.sleep(5)
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(f"{REELSCRIPT_API}/api/videos/{video_id}")
-                if resp.status_code != 200:
-                    continue
-                data = resp.json()
+            resp = await _get_client().get(f"/api/videos/{video_id}", timeout=10)
+            if resp.status_code != 200:
+                continue
+            data = resp.json()
 
             status = data.get("status")
             if status == "ready":
@@ -257,13 +346,10 @@ async def handle_url(update: Update, context: ContextTypes.DEFAULT_TYPE):
     msg = await update.message.reply_text("⬇️ 處理中...")
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{REELSCRIPT_API}/api/videos/process",
-                json={"url": text},
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().post("/api/videos/process", json={"url": text})
+        resp.raise_for_status()
+        data = resp.json()
+        _invalidate_videos()
 
         title = data.get("title") or "未命名"
         video_id = data.get("video_id", "")
@@ -290,7 +376,7 @@ def create_bot() -> Application:
     if not token:
         raise ValueError("TELEGRAM_BOT_TOKEN not set in environment")
 
-    app = Application.builder().token(token).build()
+    app = Application.builder().token(token).post_shutdown(_close_client).build()
 
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("help", cmd_help))
@@ -3,16 +3,24 @@ Transcription service — Whisper-based speech-to-text.
 Adapted from AutoReel's subtitle_generator.py (faster-whisper engine).
 """
 
+import hashlib
 import os
 import json
+import tempfile
+import threading
+import wave
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
-    """A single transcript segment with timestamps."""
+    """A single transcript segment with timestamps.
+
+    Slotted: an hour of video yields tens of thousands of these, and the
+    per-instance __dict__ would dominate their memory footprint.
+    """
     index: int
     start: float  # seconds
     end: float    # seconds
@@ -39,6 +47,7 @@ class Transcriber:
     def __init__(self, config_path: str = "config.json"):
         self.config = self._load_config(config_path)
         self._model = None
+        self._model_lock = threading.Lock()
 
     def _load_config(self, config_path: str) -> dict:
         if os.path.exists(config_path):
@@ -69,22 +78,67 @@ class Transcriber:
         if self._model is not None:
             return self._model
 
-        from faster_whisper import WhisperModel
+        # Two concurrent transcribes must not both build the model —
+        # that doubles (GPU) memory for nothing
+        with self._model_lock:
+            if self._model is not None:
+                return self._model
 
-        whisper_cfg = self.config.get("whisper", {})
-        model_name = whisper_cfg.get("model", "base")
-        device = self._get_device()
-        compute_type = whisper_cfg.get("compute_type", "int8" if device == "cpu" else "float16")
+            from faster_whisper import WhisperModel
 
-        print(f"[Whisper] Loading model: {model_name} (device={device}, compute={compute_type})")
+            whisper_cfg = self.config.get("whisper", {})
+            model_name = whisper_cfg.get("model", "base")
+            device = self._get_device()
+            compute_type = whisper_cfg.get("compute_type", "int8" if device == "cpu" else "float16")
 
-        self._model = WhisperModel(
-            model_name,
-            device=device,
-            compute_type=compute_type,
-        )
+            print(f"[Whisper] Loading model: {model_name} (device={device}, compute={compute_type})")
+
+            self._model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=os.cpu_count() or 4,
+                num_workers=1,
+            )
         return self._model
 
+    def warmup(self):
+        """Load the model and run one throwaway inference (call from startup).
+
+        The first real transcribe otherwise pays kernel JIT/autotune cost on
+        top of the model load; a 1-second silent clip absorbs both.
+        """
+        model = self._load_model()
+
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(16000)
+                wav.writeframes(b"\x00\x00" * 16000)  # 1s of silence
+            segments_gen, _ = model.transcribe(path, language="en", vad_filter=False)
+            for _ in segments_gen:  # generator — drain to actually run inference
+                pass
+        finally:
+            os.unlink(path)
+
+    def _cache_path(self, video_path: str, lang: str, max_words: int) -> Optional[Path]:
+        """Cache file for this (video bytes, model, language, max_words) combo.
+
+        Set "cache_dir": null under "whisper" in config.json to disable.
+        """
+        whisper_cfg = self.config.get("whisper", {})
+        cache_dir = whisper_cfg.get("cache_dir", "cache/whisper")
+        if not cache_dir:
+            return None
+        h = hashlib.sha256()
+        with open(video_path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                h.update(chunk)
+        key = f"{h.hexdigest()}-{whisper_cfg.get('model', 'base')}-{lang}-{max_words}"
+        return Path(cache_dir) / f"{key}.json"
+
     def transcribe(self, video_path: str, language: Optional[str] = None) -> List[Segment]:
         """
         Transcribe a video file into timestamped segments.
@@ -99,13 +153,22 @@ class Transcriber:
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video not found: {video_path}")
 
-        model = self._load_model()
         whisper_cfg = self.config.get("whisper", {})
         lang = language or whisper_cfg.get("language", "en")
         max_words = whisper_cfg.get("max_words_per_segment", 12)
         vad_filter = whisper_cfg.get("vad_filter", True)
         vad_params = whisper_cfg.get("vad_parameters", None)
 
+        # Re-processing the same bytes (crash recovery, user re-trigger)
+        # skips minutes of inference for a cache read
+        cache_path = self._cache_path(video_path, lang, max_words)
+        if cache_path and cache_path.exists():
+            print(f"[Whisper] Cache hit: {os.path.basename(video_path)}")
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return [Segment(**d) for d in json.load(f)]
+
+        model = self._load_model()
+
         print(f"[Whisper] Transcribing: {os.path.basename(video_path)} (lang={lang})")
 
         transcribe_opts = {
@@ -122,11 +185,21 @@ class Transcriber:
 
         segments = self._process_segments(segments_gen, max_words)
         print(f"[Whisper] Done — {len(segments)} segments")
+
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump([asdict(s) for s in segments], f, ensure_ascii=False)
+
         return segments
 
+    # Characters that end a sub-segment regardless of word count
+    _TERMINATORS = frozenset(".?!,")
+
     def _process_segments(self, segments_gen, max_words: int) -> List[Segment]:
         entries = []
         idx = 1
+        terminators = self._TERMINATORS
 
         for seg in segments_gen:
             words = seg.words
@@ -141,21 +214,22 @@ class Transcriber:
                 idx += 1
                 continue
 
-            # Split into shorter segments by word count and punctuation
+            # Split into shorter segments by word count and punctuation.
+            # One pass per word: strip once, test the last character
+            # against a set instead of rstrip().endswith(tuple), and
+            # count locally rather than re-measuring the list.
             current_words = []
             current_start = None
+            count = 0
 
             for w in words:
                 if current_start is None:
                     current_start = w.start
-                current_words.append(w.word.strip())
-
-                should_split = (
-                    len(current_words) >= max_words
-                    or w.word.rstrip().endswith((".", "?", "!", ","))
-                )
+                stripped = w.word.strip()
+                current_words.append(stripped)
+                count += 1
 
-                if should_split and current_words:
+                if count >= max_words or (stripped and stripped[-1] in terminators):
                     text = " ".join(current_words).strip()
                     if text:
                         entries.append(Segment(
@@ -167,6 +241,7 @@ class Transcriber:
                         idx += 1
                     current_words = []
                     current_start = None
+                    count = 0
 
             if current_words:
                 text = " ".join(current_words).strip()
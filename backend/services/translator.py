@@ -4,16 +4,17 @@ Merges Whisper fragments into sentences before translating for better accuracy.
 """
 
 import re
-import sys
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-# Add meei SDK to path
-MEEI_PATH = "C:/Users/jeffb/Desktop/code/meei/python/src"
-if MEEI_PATH not in sys.path:
-    sys.path.insert(0, MEEI_PATH)
+from services.llm import call_llm
+from services.util import parse_json_array
 
-from meei.chat import chat  # noqa: E402
+# %-style args defer formatting to the handler — nothing is built when the
+# level is off, and parallel batches don't serialize on stdout
+logger = logging.getLogger(__name__)
 
 SYSTEM_PROMPT = """You are a professional English-to-Traditional-Chinese translator.
 Translate the following English sentences into natural, fluent 繁體中文.
@@ -32,62 +33,37 @@ Example output: ["大家好。", "今天我們來聊聊打光。"]"""
 # Max sentences per batch
 BATCH_SIZE = 20
 
+# Batches translate in parallel (chat.ask is sync, so threads); bounded
+# to stay under provider rate limits
+MAX_CONCURRENT_BATCHES = 4
+
 # Provider preference order
 PROVIDERS = ["openai", "groq"]
 
+# Compiled once — _merge_into_sentences checks this per segment
+_SENT_END = re.compile(r"[.!?]$")
+
 
 def _call_llm(prompt: str) -> str:
     """Try each provider in order until one succeeds."""
-    last_error = None
-    for pv in PROVIDERS:
-        try:
-            return chat.ask(prompt, pv=pv, system=SYSTEM_PROMPT, temperature=0.3)
-        except Exception as e:
-            last_error = e
-            print(f"[Translator] {pv} failed: {e}, trying next...")
-            continue
-    raise RuntimeError(f"All translation providers failed. Last error: {last_error}")
+    return call_llm(prompt, PROVIDERS, system=SYSTEM_PROMPT, temperature=0.3,
+                    tag="Translator")
 
 
 def _parse_translations(response: str, expected_count: int) -> List[str]:
     """Extract JSON array from LLM response, with fallback parsing."""
-    text = response.strip()
-
-    # Strip markdown code fences if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
-
-    parsed = None
-
-    try:
-        result = json.loads(text)
-        if isinstance(result, list):
-            parsed = [str(t) for t in result]
-    except json.JSONDecodeError:
-        pass
-
-    # Try to find JSON array in the response
-    if parsed is None:
-        start = text.find("[")
-        end = text.rfind("]")
-        if start != -1 and end != -1:
-            try:
-                result = json.loads(text[start:end + 1])
-                if isinstance(result, list):
-                    parsed = [str(t) for t in result]
-            except json.JSONDecodeError:
-                pass
+    result = parse_json_array(response)
+    parsed = [str(t) for t in result] if result is not None else None
 
     if parsed is None:
-        print(f"[Translator] Warning: failed to parse translations from response")
-        print(f"[Translator] Response preview: {text[:200]}")
+        logger.warning("Failed to parse translations from response; preview: %s",
+                       response.strip()[:200])
         return [""] * expected_count
 
     # Pad or truncate to match expected count
     if len(parsed) != expected_count:
-        print(f"[Translator] Warning: got {len(parsed)} translations, expected {expected_count}. Adjusting...")
+        logger.warning("Got %d translations, expected %d. Adjusting...",
+                       len(parsed), expected_count)
     while len(parsed) < expected_count:
         parsed.append("")
     return parsed[:expected_count]
@@ -108,7 +84,7 @@ def _merge_into_sentences(segments: list) -> list:
         indices.append(i)
 
         # Split on sentence-ending punctuation
-        if re.search(r'[.!?]$', text):
+        if _SENT_END.search(text):
             sentences.append({"text": buf.strip(), "seg_indices": list(indices)})
             buf = ""
             indices = []
@@ -135,18 +111,29 @@ def translate_segments(segments: list) -> list:
     sentences = _merge_into_sentences(segments)
     sentence_texts = [s["text"] for s in sentences]
 
-    print(f"[Translator] Merged {len(segments)} segments into {len(sentences)} sentences")
+    logger.info("Merged %d segments into %d sentences", len(segments), len(sentences))
 
-    # Step 2: Translate sentences in batches
-    all_translations = []
-    for i in range(0, len(sentence_texts), BATCH_SIZE):
-        batch = sentence_texts[i:i + BATCH_SIZE]
-        prompt = json.dumps(batch, ensure_ascii=False)
+    # Step 2: Translate batches concurrently — each is an independent
+    # network round trip, so a long transcript no longer pays them serially
+    batches = [
+        sentence_texts[i:i + BATCH_SIZE]
+        for i in range(0, len(sentence_texts), BATCH_SIZE)
+    ]
+    logger.info("Translating %d batches...", len(batches))
+
+    def _translate_batch(batch: List[str]) -> List[str]:
+        response = _call_llm(json.dumps(batch, ensure_ascii=False))
+        return _parse_translations(response, len(batch))
 
-        print(f"[Translator] Translating batch {i // BATCH_SIZE + 1} ({len(batch)} sentences)...")
-        response = _call_llm(prompt)
-        translations = _parse_translations(response, len(batch))
-        all_translations.extend(translations)
+    all_translations = []
+    if len(batches) <= 1:
+        for batch in batches:
+            all_translations.extend(_translate_batch(batch))
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as pool:
+            # pool.map preserves batch order
+            for translations in pool.map(_translate_batch, batches):
+                all_translations.extend(translations)
 
     # Step 3: Map sentence translations back to segments
     # Store full sentence translation on the LAST segment of each sentence
@@ -156,8 +143,8 @@ def translate_segments(segments: list) -> list:
         last_seg_idx = sent["seg_indices"][-1]
         seg_translations[last_seg_idx] = translation
 
-    # Return new list with translations merged (immutable pattern)
-    return [
-        {**seg, "translation": seg_translations[i]}
-        for i, seg in enumerate(segments)
-    ]
+    # Mutate in place — copying every dict doubles peak memory on long
+    # transcripts, and no caller keeps the untranslated list around
+    for i, seg in enumerate(segments):
+        seg["translation"] = seg_translations[i]
+    return segments
@@ -0,0 +1,45 @@
+"""
+Shared LLM-response JSON extraction.
+
+Every AI service parses provider output the same way: strip markdown
+code fences in one regex pass, try orjson, then slice the outermost
+object/array and retry. Centralized here so the fallback behavior
+can't drift between copies.
+"""
+
+import re
+
+import orjson
+
+_FENCE_RE = re.compile(r"^```[a-z]*\n?|^```$", re.M)
+
+
+def _extract(text: str, open_ch: str, close_ch: str, expected_type):
+    text = _FENCE_RE.sub("", text.strip()).strip()
+    try:
+        result = orjson.loads(text)
+        if isinstance(result, expected_type):
+            return result
+    except orjson.JSONDecodeError:
+        pass
+
+    start = text.find(open_ch)
+    end = text.rfind(close_ch)
+    if start != -1 and end != -1:
+        try:
+            result = orjson.loads(text[start:end + 1])
+            if isinstance(result, expected_type):
+                return result
+        except orjson.JSONDecodeError:
+            pass
+    return None
+
+
+def parse_json_object(text: str) -> dict | None:
+    """Extract a JSON object from an LLM response, or None."""
+    return _extract(text, "{", "}", dict)
+
+
+def parse_json_array(text: str) -> list | None:
+    """Extract a JSON array from an LLM response, or None."""
+    return _extract(text, "[", "]", list)
@@ -3,15 +3,27 @@ Vocabulary analysis service — extract difficult English words with Chinese tra
 Uses meei SDK (Groq by default) for AI analysis.
 """
 
-import sys
-import json
+import hashlib
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
 
-MEEI_PATH = "C:/Users/jeffb/Desktop/code/meei/python/src"
-if MEEI_PATH not in sys.path:
-    sys.path.insert(0, MEEI_PATH)
+import orjson
 
-from meei.chat import chat  # noqa: E402
+from services.cache import cache
+from services.llm import call_llm
+from services.util import parse_json_array
+
+logger = logging.getLogger(__name__)
+
+# Same batch + prompt -> same analysis; survives restarts (cf. cache/titles)
+CACHE_DIR = Path("cache/vocab")
+
+# Per-text results also sit in the in-process TTL cache so repeated
+# phrases (intros, sponsor reads) skip the LLM within the window
+_TEXT_TTL = 3600.0
 
 SYSTEM_PROMPT = """You are an English vocabulary analyzer for intermediate Chinese-speaking learners.
 Analyze the following English subtitle segments and extract USEFUL phrases and difficult vocabulary.
@@ -20,70 +32,139 @@ Rules:
 - PRIORITIZE: phrasal verbs, idioms, collocations, multi-word expressions
   e.g. "break their trust", "done for good", "act like", "run deeper than"
 - Also include: intermediate+ single words that are NOT basic
-- SKIP all basic/common words: cared, treat, hurt, lose, find, make, keep, break, love, hate, feel, think, want, need, know, see, go, come, get, take, give, let, tell, say, ask, try, use, help, call, look, show, turn, play, run, move, hold, bring, set, put, leave, work, live, start, stop, open, close, read, write, etc.
+- SKIP basic/common everyday words
 - For each item provide the EXACT phrase as it appears and 繁體中文 translation
-- Output ONLY a JSON array of arrays, one per segment
-- Each inner array has objects with "word" and "translation" fields
-- If a segment has nothing notable, use empty array
+- Input is a JSON array of {"i": index, "t": text} objects
+- Output ONLY a JSON array with one {"i": index, "v": [...]} object per input item
+- "v" is an array of objects with "word" and "translation" fields
+- If a segment has nothing notable, use "v": []
 - Aim for 0-2 items per segment, quality over quantity
 
-Example input: ["Once you break their trust, that's it", "They forgive not because they're weak"]
-Example output: [[{"word":"break their trust","translation":"破壞他們的信任"}],[{"word":"forgive","translation":"原諒"}]]"""
+Example input: [{"i":0,"t":"Once you break their trust, that's it"},{"i":1,"t":"They forgive not because they're weak"}]
+Example output: [{"i":0,"v":[{"word":"break their trust","translation":"破壞他們的信任"}]},{"i":1,"v":[{"word":"forgive","translation":"原諒"}]}]"""
 
-BATCH_SIZE = 20
+# Indexed rows let the parser reconcile dropped/reordered items, which
+# makes larger batches safe — fewer round trips per transcript
+BATCH_SIZE = 40
 PROVIDERS = ["openai", "groq"]
 
+# Batches analyze in parallel (chat.ask is sync, so threads); bounded to
+# stay under provider rate limits — same shape as translator.py
+MAX_CONCURRENT_BATCHES = 4
 
-def _call_llm(prompt: str) -> str:
-    last_error = None
-    for pv in PROVIDERS:
-        try:
-            return chat.ask(prompt, pv=pv, system=SYSTEM_PROMPT, temperature=0.2)
-        except Exception as e:
-            last_error = e
-            print(f"[Vocabulary] {pv} failed: {e}, trying next...")
-            continue
-    raise RuntimeError(f"All providers failed. Last error: {last_error}")
 
+# Basic words filtered in Python instead of enumerated in the prompt —
+# segments built entirely from these have nothing worth asking about,
+# and every request stops paying tokens for the stop-word list
+BASIC_WORDS = frozenset("""
+about above after again almost along already always another anything around
+because before being better bring brings cared cares close comes could doing
+early either enough every first found getting gives going great group having
+house large later learn leave little lives looks maybe might money moved
+moving never night often other people place plays point really right round
+seems should since small something sometimes start started still story
+taken takes there thing things think those three through today together turned
+under until wanted watch water where which while whole words working world
+would wrote young
+""".split())
+
+_TOKEN_RE = re.compile(r"[A-Za-z']+")
 
-def _parse_vocabulary(response: str, expected_count: int) -> list:
-    text = response.strip()
 
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
+def _has_candidate(text: str) -> bool:
+    """True if the text contains at least one word worth analyzing.
 
-    parsed = None
+    Short tokens are phrasal-verb material at best — those only matter in
+    segments that also contain a longer, non-basic word.
+    """
+    return any(
+        len(tok) >= 5 and tok not in BASIC_WORDS
+        for tok in _TOKEN_RE.findall(text.lower())
+    )
 
-    try:
-        result = json.loads(text)
-        if isinstance(result, list):
-            parsed = result
-    except json.JSONDecodeError:
-        pass
 
-    if parsed is None:
-        start = text.find("[")
-        end = text.rfind("]")
-        if start != -1 and end != -1:
-            try:
-                result = json.loads(text[start:end + 1])
-                if isinstance(result, list):
-                    parsed = result
-            except json.JSONDecodeError:
-                pass
+def _text_key(text: str) -> str:
+    return "vocab:text:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _batch_cache_path(prompt: str) -> Path:
+    key = hashlib.sha256((SYSTEM_PROMPT + prompt).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
 
+def _call_llm(prompt: str) -> str:
+    """Try each provider in order until one succeeds."""
+    return call_llm(prompt, PROVIDERS, system=SYSTEM_PROMPT, temperature=0.2,
+                    tag="Vocabulary")
+
+
+def _recover_inner_items(text: str) -> list | None:
+    """Salvage per-row items when the whole payload won't parse.
+
+    Tracks top-level nesting depth inside the outer array and parses each
+    {...} or [...] element independently, so one malformed row yields []
+    for itself instead of zeroing out the entire batch. Best-effort:
+    brackets inside strings can confuse it, but this only runs after the
+    normal parse has already failed.
+    """
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end <= start:
+        return None
+    body = text[start + 1:end]
+
+    items: list = []
+    depth = 0
+    item_start = 0
+    for i, ch in enumerate(body):
+        if ch in "[{":
+            if depth == 0:
+                item_start = i
+            depth += 1
+        elif ch in "]}" and depth:
+            depth -= 1
+            if depth == 0:
+                try:
+                    items.append(orjson.loads(body[item_start:i + 1]))
+                except orjson.JSONDecodeError:
+                    items.append([])
+    return items or None
+
+
+def _parse_vocabulary(response: str, expected_count: int) -> tuple:
+    """Parse a batch response into per-row vocab lists.
+
+    Returns (rows, complete) — complete is True only when every expected
+    row was reconciled, so callers know whether the result is safe to
+    persist or just a best-effort salvage.
+    """
+    parsed = parse_json_array(response)
     if parsed is None:
-        print(f"[Vocabulary] Warning: failed to parse vocabulary from response")
-        print(f"[Vocabulary] Response preview: {text[:200]}")
-        return [[] for _ in range(expected_count)]
+        parsed = _recover_inner_items(response)
 
-    if len(parsed) != expected_count:
-        print(f"[Vocabulary] Warning: got {len(parsed)} results, expected {expected_count}. Adjusting...")
-    while len(parsed) < expected_count:
-        parsed.append([])
-    return parsed[:expected_count]
+    if parsed is None:
+        logger.warning("Failed to parse vocabulary from response; preview: %s",
+                       response.strip()[:200])
+        return [[] for _ in range(expected_count)], False
+
+    # Reconcile by the echoed index — the model dropping or reordering
+    # rows no longer shifts every later segment's vocabulary
+    out: list = [[] for _ in range(expected_count)]
+    matched = 0
+    for pos, item in enumerate(parsed):
+        if isinstance(item, dict) and isinstance(item.get("i"), int):
+            i = item["i"]
+            v = item.get("v", [])
+            if 0 <= i < expected_count and isinstance(v, list):
+                out[i] = v
+                matched += 1
+        elif isinstance(item, list) and pos < expected_count:
+            # Model ignored the indexed schema — take rows positionally
+            out[pos] = item
+            matched += 1
+    if matched != expected_count:
+        logger.warning("Matched %d of %d vocabulary rows", matched, expected_count)
+    return out, matched == expected_count
 
 
 def analyze_segments(segments: list) -> list:
@@ -98,17 +179,72 @@ def analyze_segments(segments: list) -> list:
     """
     texts = [seg.get("text", "") for seg in segments]
 
-    all_vocab = []
-    for i in range(0, len(texts), BATCH_SIZE):
-        batch = texts[i:i + BATCH_SIZE]
-        prompt = json.dumps(batch, ensure_ascii=False)
+    # Resolve what we already know before spending tokens: blanks get [],
+    # cached texts hit the TTL cache, and duplicate texts (repeated
+    # phrases, "[Music]" markers) are sent once and scattered back
+    resolved: list = [None] * len(texts)
+    pending: List[str] = []
+    owners: dict = {}  # text -> segment indices awaiting its result
+    for i, text in enumerate(texts):
+        if not text.strip() or not _has_candidate(text):
+            resolved[i] = []
+            continue
+        hit = cache.get(_text_key(text))
+        if hit is not None:
+            resolved[i] = hit
+            continue
+        if text in owners:
+            owners[text].append(i)
+        else:
+            owners[text] = [i]
+            pending.append(text)
+
+    # Each batch is an independent network round trip — run them
+    # concurrently instead of paying N round trips serially
+    batches = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+    if batches:
+        logger.info("Analyzing %d batches (%d of %d texts cached or skipped)...",
+                    len(batches), len(texts) - len(pending), len(texts))
+
+    def _analyze_batch(batch: List[str]) -> list:
+        # orjson emits UTF-8 directly, matching ensure_ascii=False
+        prompt = orjson.dumps(
+            [{"i": i, "t": t} for i, t in enumerate(batch)]
+        ).decode()
+
+        # Identical batch seen before (re-run, crash recovery) — disk hit
+        batch_path = _batch_cache_path(prompt)
+        if batch_path.exists():
+            try:
+                return orjson.loads(batch_path.read_bytes())
+            except orjson.JSONDecodeError:
+                pass  # corrupt entry — regenerate
 
-        print(f"[Vocabulary] Analyzing batch {i // BATCH_SIZE + 1} ({len(batch)} segments)...")
         response = _call_llm(prompt)
-        vocab_batch = _parse_vocabulary(response, len(batch))
-        all_vocab.extend(vocab_batch)
-
-    return [
-        {**seg, "vocabulary": all_vocab[i] if i < len(all_vocab) else []}
-        for i, seg in enumerate(segments)
-    ]
+        vocab_batch, complete = _parse_vocabulary(response, len(batch))
+        # Only a fully-reconciled batch is worth pinning to disk — caching
+        # a garbage-but-200 response would lock in empty rows permanently;
+        # partial salvage stays usable now but gets retried on a re-run
+        if complete:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            batch_path.write_bytes(orjson.dumps(vocab_batch))
+        return vocab_batch
+
+    if len(batches) <= 1:
+        results = [_analyze_batch(b) for b in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as pool:
+            # pool.map preserves batch order
+            results = list(pool.map(_analyze_batch, batches))
+
+    for batch, vocab_batch in zip(batches, results):
+        for text, vocab in zip(batch, vocab_batch):
+            cache.set(_text_key(text), vocab, ttl=_TEXT_TTL)
+            for j in owners[text]:
+                resolved[j] = vocab
+
+    # Mutate in place — copying every dict doubles peak memory on long
+    # transcripts, and no caller keeps the unanalyzed list around
+    for i, seg in enumerate(segments):
+        seg["vocabulary"] = resolved[i] if resolved[i] is not None else []
+    return segments